@@ -1,20 +1,40 @@
 from __future__ import annotations
-from typing import Dict, Literal, Tuple
+import heapq
+from functools import lru_cache
+from typing import Dict, List, Literal, Tuple
 
 from .rng import RNG
 
 ExternalKey = Literal["start","corner","oob","competing","tenacious","spurt"]
 MIN_V, MAX_V = 8, 48
 
+EXTERNAL_KEYS: Tuple[ExternalKey, ...] = ("start", "corner", "oob", "competing", "tenacious", "spurt")
+
+_MISSING = object()
+
 def clamp_int(x: int, lo: int, hi: int) -> int:
     return lo if x < lo else hi if x > hi else x
 
 def safe_get(obj, key: str) -> int:
-    return int(getattr(obj, key)) if hasattr(obj, key) else int(obj[key])
+    v = getattr(obj, key, _MISSING)
+    return int(v) if v is not _MISSING else int(obj[key])
 
 def floor_avg(a: int, b: int) -> int:
     return (a + b) // 2
 
+@lru_cache(maxsize=2048)
+def _expected_ext(a: int, b: int, n_shift: float, gamma: float) -> float:
+    """Noise-free 8..48 birth value for one external, from 0..16 parent stats.
+
+    Pure in its (small, discrete) inputs, so results are memoized.
+    """
+    a0 = clamp_int(a, 0, 16)
+    b0 = clamp_int(b, 0, 16)
+    denom = 16 if (a0 == 16 or b0 == 16) else 15
+    n = ((a0 + b0) / 2.0) / float(denom)
+    n = max(0.0, min(1.0, n + n_shift))
+    return MIN_V + (MAX_V - MIN_V) * (n ** gamma)
+
 def breed_internals(sire, dam) -> Dict[str, int]:
     return {
         "stamina": floor_avg(int(sire.stamina), int(dam.stamina)),
@@ -34,7 +54,6 @@ def compute_birth_ext_8_48_from_parents(
     genetic_tokens_sire: int = 0,
     genetic_tokens_dam: int = 0
 ) -> Dict[ExternalKey, int]:
-    keys: Tuple[ExternalKey, ...] = ("start","corner","oob","competing","tenacious","spurt")
     gamma = 1.6
     sd_base = 2.2
     anom_p = 0.035
@@ -44,51 +63,71 @@ def compute_birth_ext_8_48_from_parents(
     n_shift = 0.03 * max(0, min(t_total, 6))
     cap_sum = min(180, cap_sum + min(4 * t_total, 20))
 
-    out: Dict[ExternalKey, int] = {}
-    for k in keys:
-        a0 = clamp_int(safe_get(sire, k), 0, 16)
-        b0 = clamp_int(safe_get(dam, k), 0, 16)
-        denom = 16 if (a0 == 16 or b0 == 16) else 15
-        n = ((a0 + b0) / 2.0) / float(denom)
-        n = max(0.0, min(1.0, n + n_shift))
-        expected = MIN_V + (MAX_V - MIN_V) * (n ** gamma)
+    # Fetch parent stats once; the rest of the function works on parallel
+    # int lists in EXTERNAL_KEYS order.
+    sire_vals = [safe_get(sire, k) for k in EXTERNAL_KEYS]
+    dam_vals = [safe_get(dam, k) for k in EXTERNAL_KEYS]
 
-        noise = rng.tri_centered() * sd_base * 2.0
+    # Deterministic part first (whole 6-key vector), then the noise pass.
+    expected_vals = [_expected_ext(sv, dv, n_shift, gamma) for sv, dv in zip(sire_vals, dam_vals)]
 
-        if rng.random() < anom_p:
-            p_pos = min(0.70, 0.50 + 0.05 * t_total)
-            sign = 1.0 if (rng.random() < p_pos) else -1.0
-            noise += sign * (rng.random() * anom_mag)
+    # The RNG draw order per key (tri_centered, anomaly roll, [sign, magnitude])
+    # must stay fixed so seeded births are reproducible.
+    tri = rng.tri_centered
+    rand = rng.random
+    noise_scale = sd_base * 2.0
+    p_pos = min(0.70, 0.50 + 0.05 * t_total)
 
-        v = int(expected + noise)
-        out[k] = clamp_int(v, MIN_V, MAX_V)
+    out: List[int] = []
+    for expected in expected_vals:
+        noise = tri() * noise_scale
 
-    # cap enforcement
-    def sum_ext(d: Dict[ExternalKey, int]) -> int:
-        return sum(d[k] for k in keys)
+        if rand() < anom_p:
+            sign = 1.0 if (rand() < p_pos) else -1.0
+            noise += sign * (rand() * anom_mag)
 
+        v = int(expected + noise)
+        out.append(MIN_V if v < MIN_V else MAX_V if v > MAX_V else v)
+
+    # cap enforcement: proportional cuts until a pass stops making progress
+    # (small excesses round every cut to 0, so further passes are no-ops) ...
+    total = sum(out)
     for _ in range(20):
-        s = sum_ext(out)
-        if s <= cap_sum:
+        excess = total - cap_sum
+        if excess <= 0:
             break
-        excess = s - cap_sum
-        reducibles = [(k, out[k] - MIN_V) for k in keys if out[k] > MIN_V]
+        reducibles = [(i, v - MIN_V) for i, v in enumerate(out) if v > MIN_V]
         total_room = sum(r for _, r in reducibles)
         if total_room <= 0:
             break
-        for k, room in reducibles:
+        changed = False
+        for i, room in reducibles:
             cut = int(round(excess * (room / total_room)))
             if cut <= 0:
                 continue
-            out[k] = max(MIN_V, out[k] - cut)
-
-    while sum_ext(out) > cap_sum:
-        kmax = max(keys, key=lambda kk: out[kk])
-        if out[kmax] <= MIN_V:
+            # cut past the floor only takes the remaining room
+            if cut > room:
+                cut = room
+            out[i] -= cut
+            total -= cut
+            changed = True
+        if not changed:
             break
-        out[kmax] -= 1
 
-    return out
+    # ... then shave the residue one point at a time off the highest value
+    # (lowest index wins ties).
+    residue = total - cap_sum
+    if residue > 0:
+        heap = [(-v, i) for i, v in enumerate(out) if v > MIN_V]
+        heapq.heapify(heap)
+        while residue > 0 and heap:
+            neg_v, i = heapq.heappop(heap)
+            out[i] -= 1
+            residue -= 1
+            if out[i] > MIN_V:
+                heapq.heappush(heap, (neg_v + 1, i))
+
+    return dict(zip(EXTERNAL_KEYS, out))
 
 
 def derive_leg_type(racing_ext: Dict[ExternalKey, int]) -> str:
@@ -103,13 +142,20 @@ def derive_leg_type(racing_ext: Dict[ExternalKey, int]) -> str:
 
     We compare: START, OOB, COMPETING, TENACIOUS, SPURT (CORNER excluded).
     """
-    compare = ["start","oob","competing","tenacious","spurt"]
-    vals = [racing_ext[k] for k in compare]
-    if max(vals) - min(vals) <= 3:
+    start = racing_ext["start"]
+    vmin = vmax = start
+    greater = 0
+    for k in ("oob", "competing", "tenacious", "spurt"):
+        v = racing_ext[k]
+        if v < vmin:
+            vmin = v
+        elif v > vmax:
+            vmax = v
+        if v > start:
+            greater += 1
+    if vmax - vmin <= 3:
         return "AL"
 
-    start = racing_ext["start"]
-    greater = sum(1 for k in compare if racing_ext[k] > start)
     if greater == 0:
         return "FR"
     if greater == 1:
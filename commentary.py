@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 from .models import Horse, Condition, Surface
 from .roster import ParentHorse
@@ -9,17 +10,20 @@ from .schedule import RaceMeta
 from .rng import RNG, hash64
 
 
+_MISSING = object()
+
+
 def _iget(obj, key: str, default: int = 0) -> int:
     """Get an internal stat from either a dataclass-like object or a dict."""
     if obj is None:
         return default
-    if isinstance(obj, dict):
-        try:
-            return int(obj.get(key, default))
-        except Exception:
+    v = getattr(obj, key, _MISSING)
+    if v is _MISSING:
+        if not isinstance(obj, dict):
             return default
+        v = obj.get(key, default)
     try:
-        return int(getattr(obj, key))
+        return int(v)
     except Exception:
         return default
 
@@ -28,48 +32,56 @@ def _eget(obj, key: str, default: int = 0) -> int:
     """Get an external stat from either a dataclass-like object or a dict."""
     if obj is None:
         return default
-    if isinstance(obj, dict):
-        try:
-            return int(obj.get(key, default))
-        except Exception:
+    v = getattr(obj, key, _MISSING)
+    if v is _MISSING:
+        if not isinstance(obj, dict):
             return default
+        v = obj.get(key, default)
     try:
-        return int(getattr(obj, key))
+        return int(v)
     except Exception:
         return default
 
 
+_TURF_IDEAL_AC = 128.0
+_INV_TURF_IDEAL_AC = 1.0 / _TURF_IDEAL_AC  # exact (power of two)
+_DIRT_IDEAL_AC = 255.0
+
+
+@lru_cache(maxsize=4096)
 def _surface_preference_scalar(ac: float, surface: Surface, condition: Condition) -> float:
     """
     Mirror the race_engine surface-preference scalar (but kept local to avoid import cycles).
     Higher AC favors DIRT; ~128 favors TURF. Heavy dirt punishes non-dirt types a bit more.
+
+    Memoized: callers pass whole-number AC values, so the key space is small.
     """
-    ac = max(0.0, min(255.0, ac))
+    if not 0.0 <= ac <= 255.0:
+        ac = 0.0 if ac < 0.0 else 255.0
 
     if surface == "TURF":
-        ideal = 128.0
-        diff = abs(ac - ideal) / ideal  # 0..~1
+        diff = abs(ac - _TURF_IDEAL_AC) * _INV_TURF_IDEAL_AC  # 0..~1
         scalar = 1.0 - 0.18 * diff
-        scalar = max(0.78, scalar)
-        return scalar
+        return scalar if scalar > 0.78 else 0.78
 
-    # DIRT
-    ideal = 255.0
-    diff = abs(ac - ideal) / ideal
+    # DIRT (ac <= ideal after clamping, so the abs() is not needed)
+    diff = (_DIRT_IDEAL_AC - ac) / _DIRT_IDEAL_AC
     scalar = 1.0 - 0.22 * diff
     if condition == "HEAVY":
         scalar -= 0.04 * diff
     elif condition == "SOFT":
         scalar -= 0.015 * diff
-    scalar = max(0.78, scalar)
-    return scalar
+    return scalar if scalar > 0.78 else 0.78
 
 
+@lru_cache(maxsize=4096)
 def _distance_profile_scalar(distance: int, stamina: float, sharp: float) -> float:
     """
     Mirror the race_engine distance scalar in a simplified form:
     - "Sharp" horses struggle as distance grows.
     - "Stamina" horses can lack zip on short sprints.
+
+    Memoized: distances are race-granular and stamina/sharp are whole numbers.
     """
     d = float(distance)
     sharpness = sharp - stamina
@@ -88,57 +100,162 @@ def _distance_profile_scalar(distance: int, stamina: float, sharp: float) -> flo
     return 1.0
 
 
+_EXT_KEYS = ("start", "corner", "oob", "competing", "tenacious", "spurt")
+_START, _CORNER, _OOB, _COMP, _TEN, _SPURT = range(6)
+
+# Per-leg style weights as (index into _EXT_KEYS, weight) pairs. Terms are
+# listed in the order they are summed so results match the original formulas
+# bit-for-bit. Unknown leg types fall back to SR.
+_STYLE_WEIGHTS = {
+    "FR": ((_START, 0.36), (_CORNER, 0.26), (_COMP, 0.14), (_TEN, 0.10), (_SPURT, 0.14)),
+    "SD": ((_START, 0.42), (_OOB, 0.16), (_CORNER, 0.18), (_COMP, 0.10), (_SPURT, 0.14)),
+    "LS": ((_START, 0.18), (_OOB, 0.18), (_CORNER, 0.14), (_COMP, 0.14), (_SPURT, 0.36)),
+    "SR": ((_START, 0.20), (_CORNER, 0.22), (_COMP, 0.16), (_TEN, 0.12), (_SPURT, 0.30)),
+}
+
+# Hot-path membership tests on leg/going codes. The codes stay strings (they
+# are persisted in saves); str hashes are cached, so set lookups are cheap.
+_CLOSER_LEGS = frozenset(("LS", "SR"))
+_SOFT_GOING = frozenset(("HEAVY", "SOFT", "GOOD_TO_SOFT"))
+
+_CONDITION_SCALAR = {
+    "FIRM": 1.00,
+    "GOOD": 1.00,
+    "SOFT": 0.985,
+    "GOOD_TO_SOFT": 0.985,
+    "HEAVY": 0.965,
+}
+
+
+def _gate_scalar(g: int) -> float:
+    mid = 6.5
+    gate_pen = abs(g - mid) / mid  # 0..~0.85
+    return 1.0 - 0.03 * gate_pen
+
+
+# Indexed by gate 1..12 (slot 0 unused).
+_GATE_SCALAR = tuple(_gate_scalar(g) for g in range(13))
+
+
 def expected_score(h: Horse, race: RaceMeta, condition: Condition, gate: int) -> float:
     """
     A deterministic 'on paper' score (no noise), used only for commentary/expectation checks.
     """
-    st = float(_iget(getattr(h, "internals", None), "stamina", 0))
-    sp = float(_iget(getattr(h, "internals", None), "speed", 0))
-    sh = float(_iget(getattr(h, "internals", None), "sharp", 0))
-
-    start = float(_eget(getattr(h, "externals", None), "start", 8))
-    corner = float(_eget(getattr(h, "externals", None), "corner", 8))
-    oob = float(_eget(getattr(h, "externals", None), "oob", 8))
-    comp = float(_eget(getattr(h, "externals", None), "competing", 8))
-    ten = float(_eget(getattr(h, "externals", None), "tenacious", 8))
-    spurt = float(_eget(getattr(h, "externals", None), "spurt", 8))
-
-    # Base internal power: speed-forward, with stamina & sharp contributions
-    ip = 0.46 * sp + 0.30 * st + 0.24 * sh
-
-    # Style weighting: keep the same "feel" as race_engine
-    leg = getattr(h, "leg_type", "SR") or "SR"
-    if leg == "FR":
-        style = 0.36 * start + 0.26 * corner + 0.14 * comp + 0.10 * ten + 0.14 * spurt
-    elif leg == "SD":
-        style = 0.42 * start + 0.16 * oob + 0.18 * corner + 0.10 * comp + 0.14 * spurt
-    elif leg == "LS":
-        style = 0.18 * start + 0.18 * oob + 0.14 * corner + 0.14 * comp + 0.36 * spurt
-    else:  # SR
-        style = 0.20 * start + 0.22 * corner + 0.16 * comp + 0.12 * ten + 0.30 * spurt
+    return expected_scores((h,), race, condition, (gate,))[0]
 
-    style_scalar = 0.84 + (style / 48.0) * 0.22
-
-    ac = float(getattr(h, "ac", 128))
-    surface_scalar = _surface_preference_scalar(ac, race.surface, condition)
-    distance_scalar = _distance_profile_scalar(race.distance, st, sh)
 
+def expected_scores(
+    horses: Sequence[Horse], race: RaceMeta, condition: Condition, gates: Sequence[int]
+) -> List[float]:
+    """`expected_score` for each horse at its gate, with the race-wide factors looked up once."""
+    surface = race.surface
+    distance = race.distance
     # Condition scalar: light penalty on soft/heavy, more on heavy
-    condition_scalar = {
-        "FIRM": 1.00,
-        "GOOD": 1.00,
-        "SOFT": 0.985,
-        "GOOD_TO_SOFT": 0.985,
-        "HEAVY": 0.965,
-    }.get(condition, 1.00)
-
-    # Gate scalar: modest penalty for very wide/inside draws (handled in race_engine too)
-    g = max(1, min(12, int(gate)))
-    mid = 6.5
-    gate_pen = abs(g - mid) / mid  # 0..~0.85
-    gate_scalar = 1.0 - 0.03 * gate_pen
-
-    return ip * style_scalar * surface_scalar * distance_scalar * condition_scalar * gate_scalar
+    condition_scalar = _CONDITION_SCALAR.get(condition, 1.00)
+    sr_weights = _STYLE_WEIGHTS["SR"]
+
+    out: List[float] = []
+    for h, gate in zip(horses, gates):
+        ints = getattr(h, "internals", None)
+        st = float(_iget(ints, "stamina", 0))
+        sp = float(_iget(ints, "speed", 0))
+        sh = float(_iget(ints, "sharp", 0))
+
+        exts = getattr(h, "externals", None)
+        ext = [float(_eget(exts, k, 8)) for k in _EXT_KEYS]
+
+        # Base internal power: speed-forward, with stamina & sharp contributions
+        ip = 0.46 * sp + 0.30 * st + 0.24 * sh
+
+        # Style weighting: keep the same "feel" as race_engine
+        leg = getattr(h, "leg_type", "SR") or "SR"
+        # Plain left-to-right adds, as the original per-style expressions did:
+        # sum() of floats is compensated from Python 3.12 and can differ in the
+        # last bits, which would move near-tie Fav ranks for the same seed.
+        style = 0.0
+        for i, w in _STYLE_WEIGHTS.get(leg, sr_weights):
+            style += w * ext[i]
+
+        style_scalar = 0.84 + (style / 48.0) * 0.22
+
+        ac = float(getattr(h, "ac", 128))
+        surface_scalar = _surface_preference_scalar(ac, surface, condition)
+        distance_scalar = _distance_profile_scalar(distance, st, sh)
+
+        # Gate scalar: modest penalty for very wide/inside draws (handled in race_engine too)
+        gate_scalar = _GATE_SCALAR[max(1, min(12, int(gate)))]
+
+        out.append(ip * style_scalar * surface_scalar * distance_scalar * condition_scalar * gate_scalar)
+    return out
+
+
+# Static commentary text. Lines with {placeholders} are formatted only after
+# a line has been picked (the pick depends on the tuple length alone).
+_TRAIT_HINTS = {
+    "stamina": "Plenty of lungs in the pedigree.",
+    "speed": "Speed runs deep in this family.",
+    "sharp": "Quick feet and sharper instincts in the bloodline.",
+}
+
+_MALE_BIRTH_LINES = (
+    "A colt hits the ground with purpose.",
+    "A colt arrives—full of swagger.",
+    "A colt is born, and the barn gets louder.",
+    "A colt steps out like he owns the place.",
+)
+
+_FEMALE_BIRTH_LINES = (
+    "A filly arrives with a steady eye.",
+    "A filly is born—light on her feet.",
+    "A filly arrives, calm but confident.",
+    "A filly steps out and the barn goes quiet.",
+)
+
+_SURF_LINES = (
+    "Trainer's note: That looked like a {want} runner on {surf}.",
+    "Track talk: Surface matters—{want} types can struggle on {surf}.",
+)
+
+_GOING_LINES = (
+    "The going was deep—{cond_lower} {surf} can punish the wrong type.",
+    "Not a clean trip in that footing. {cond_title} tracks can sap a runner.",
+)
+
+_TRIP_LINES = (
+    "That was a stamina course—sharp types can fade when the trip stretches.",
+    "Long trip, sharp build. More stamina (or a shorter race) usually helps.",
+)
+
+_SPRINT_LINES = (
+    "Too sharp a sprint for a stayer—needed more early zip.",
+    "Short trip, big lungs. Sprinters get first run here.",
+)
+
+_GATE_LINES = (
+    "Bad draw: gate {gate} can force a wide trip.",
+    "Gate {gate} meant extra ground—hard to make it up.",
+)
+
+_TRAFFIC_LINES = (
+    "Traffic trouble: needed more Out of the Box to find daylight.",
+    "Got bottled up—Out of the Box helps you cut through the pack.",
+)
+
+_FADE_LINES = (
+    "Went forward early, but the finish asked for more Tenacious.",
+    "Led them up—and then the long run home bit back. Tenacious helps you hold.",
+)
+
+_BREAK_LINES = (
+    "Slow away from the gate—Start matters when you're meant to go forward.",
+    "Missed the jump. A front-runner wants a cleaner break.",
+)
+
+_GENERIC_LINES = (
+    "Didn't find a rhythm today—sometimes it's just not their day.",
+    "That one never got comfortable. Keep tuning the build and try again.",
+    "A puzzling run—might have been the trip, might have been the day.",
+)
 
 
 def birth_comment(seed: int, sex: str, sire: ParentHorse, dam: ParentHorse) -> str:
@@ -151,28 +268,10 @@ def birth_comment(seed: int, sex: str, sire: ParentHorse, dam: ParentHorse) -> s
     sh = (_iget(sire, "sharp", 0) + _iget(dam, "sharp", 0)) / 2.0
 
     trait = max([("stamina", st), ("speed", sp), ("sharp", sh)], key=lambda x: x[1])[0]
-
-    trait_hint = {
-        "stamina": "Plenty of lungs in the pedigree.",
-        "speed": "Speed runs deep in this family.",
-        "sharp": "Quick feet and sharper instincts in the bloodline.",
-    }.get(trait, "Hard to say yet—time will tell.")
-
-    male_lines = [
-        "A colt hits the ground with purpose.",
-        "A colt arrives—full of swagger.",
-        "A colt is born, and the barn gets louder.",
-        "A colt steps out like he owns the place.",
-    ]
-    female_lines = [
-        "A filly arrives with a steady eye.",
-        "A filly is born—light on her feet.",
-        "A filly arrives, calm but confident.",
-        "A filly steps out and the barn goes quiet.",
-    ]
+    trait_hint = _TRAIT_HINTS.get(trait, "Hard to say yet—time will tell.")
 
     rng = RNG(hash64(seed, "birth", sire.name, dam.name, sex))
-    lead = rng.choice(female_lines if sex == "F" else male_lines)
+    lead = rng.choice(_FEMALE_BIRTH_LINES if sex == "F" else _MALE_BIRTH_LINES)
     return f"Stable note: {lead} {trait_hint}"
 
 
@@ -182,23 +281,23 @@ def race_insight_lines(
     race: RaceMeta,
     condition: Condition,
     *,
-    expected_rank: int,
+    expected_rank: Union[int, Callable[[], int]],
     actual_pos: int,
     gate: int,
 ) -> List[str]:
     """
     Post-race commentary meant to hint at hidden modifiers (surface, distance, gate, style traffic).
     Only triggers when the horse underperforms vs expectation.
+
+    `expected_rank` may be a zero-argument callable; it is only called when the
+    finish alone does not decide whether a comment is shown.
     """
     field_size = 12  # DOCSim always runs 12-horse fields today
 
-    # We want these comments to show up often enough to be helpful (without spamming).
-    #
-    # "Underperformed" = finished meaningfully worse than the on-paper expectation.
-    # Keeping this threshold moderately low makes it more likely the player sees feedback
-    # about surface/distance/gate/style mismatches during normal play.
-    underperformed = (actual_pos - expected_rank) >= 2 or (expected_rank <= 4 and actual_pos >= 6)
-
+    # A top-2 finish can neither underperform (needs >= 2 places below an
+    # expected rank of at least 1, or 6th or worse) nor trip the mismatch rule.
+    if actual_pos <= 2:
+        return []
 
     # Gather basics
     ac = float(getattr(horse, "ac", 128))
@@ -221,99 +320,155 @@ def race_insight_lines(
     # Even if the horse was expected to be poor on paper, we still want to hint at why.
     # If the horse finishes mid-pack or worse AND has a notable mismatch, show a comment.
     mismatch_trigger = (actual_pos >= 5) and (surf_scalar <= 0.93 or dist_scalar <= 0.95)
-    if not (underperformed or mismatch_trigger):
-        return []
+    if not mismatch_trigger:
+        # We want these comments to show up often enough to be helpful (without spamming).
+        #
+        # "Underperformed" = finished meaningfully worse than the on-paper expectation.
+        # Keeping this threshold moderately low makes it more likely the player sees feedback
+        # about surface/distance/gate/style mismatches during normal play.
+        if callable(expected_rank):
+            expected_rank = expected_rank()
+        underperformed = (actual_pos - expected_rank) >= 2 or (expected_rank <= 4 and actual_pos >= 6)
+        if not underperformed:
+            return []
 
 
     # Preference text
     pref_surface = "DIRT" if ac >= 200 else ("TURF" if ac <= 160 else "MIXED")
     surf_name = "dirt" if race.surface == "DIRT" else "turf"
 
-    reasons: List[Tuple[float, str]] = []
+    # Candidate reasons as (score, salt, lines, format kwargs). Each reason has
+    # its own hash64 stream, so only the winning one needs an RNG.
+    reasons: List[Tuple[float, str, Tuple[str, ...], Optional[dict]]] = []
 
     # Surface mismatch
     if pref_surface != "MIXED" and pref_surface != race.surface and surf_scalar <= 0.93:
         want = "dirt" if pref_surface == "DIRT" else "turf"
-        lines = [
-            f"Trainer's note: That looked like a {want} runner on {surf_name}.",
-            f"Track talk: Surface matters—{want} types can struggle on {surf_name}.",
-        ]
-        reasons.append((1.00 + (0.93 - surf_scalar) * 2.0, RNG(hash64(seed, 'c_surf', horse.id, race.name)).choice(lines)))
+        reasons.append((1.00 + (0.93 - surf_scalar) * 2.0, 'c_surf', _SURF_LINES, {"want": want, "surf": surf_name}))
 
     # Heavy/soft going
-    if condition in ("HEAVY", "SOFT", "GOOD_TO_SOFT"):
+    if condition in _SOFT_GOING:
         # If they're already mismatched, we don't need to double-dip.
         if surf_scalar <= 0.96:
-            lines = [
-                f"The going was deep—{condition.lower().replace('_', ' ')} {surf_name} can punish the wrong type.",
-                f"Not a clean trip in that footing. {condition.title().replace('_', ' ')} tracks can sap a runner.",
-            ]
-            reasons.append((0.70 + (1.0 - surf_scalar) * 1.0, RNG(hash64(seed, 'c_going', horse.id, race.name)).choice(lines)))
+            fmt = {
+                "cond_lower": condition.lower().replace('_', ' '),
+                "cond_title": condition.title().replace('_', ' '),
+                "surf": surf_name,
+            }
+            reasons.append((0.70 + (1.0 - surf_scalar) * 1.0, 'c_going', _GOING_LINES, fmt))
 
     # Distance mismatch for sharp horses on stamina courses
     if race.distance >= 2400 and sharpness > 8 and dist_scalar < 0.98:
-        lines = [
-            "That was a stamina course—sharp types can fade when the trip stretches.",
-            "Long trip, sharp build. More stamina (or a shorter race) usually helps.",
-        ]
-        reasons.append((0.90 + (0.98 - dist_scalar) * 3.0, RNG(hash64(seed, 'c_trip', horse.id, race.name)).choice(lines)))
+        reasons.append((0.90 + (0.98 - dist_scalar) * 3.0, 'c_trip', _TRIP_LINES, None))
 
     # Sprint dullness for stamina horses
     if race.distance <= 1400 and (st - sh) > 10 and dist_scalar < 0.98:
-        lines = [
-            "Too sharp a sprint for a stayer—needed more early zip.",
-            "Short trip, big lungs. Sprinters get first run here.",
-        ]
-        reasons.append((0.80 + (0.98 - dist_scalar) * 3.0, RNG(hash64(seed, 'c_sprint', horse.id, race.name)).choice(lines)))
+        reasons.append((0.80 + (0.98 - dist_scalar) * 3.0, 'c_sprint', _SPRINT_LINES, None))
 
     # Gate trouble (outside)
     if gate in (11, 12) and actual_pos >= 7:
-        lines = [
-            f"Bad draw: gate {gate} can force a wide trip.",
-            f"Gate {gate} meant extra ground—hard to make it up.",
-        ]
-        reasons.append((0.55, RNG(hash64(seed, 'c_gate', horse.id, race.name)).choice(lines)))
+        reasons.append((0.55, 'c_gate', _GATE_LINES, {"gate": gate}))
 
     # Style/traffic hints for closers
-    if leg in ("LS", "SR"):
+    if leg in _CLOSER_LEGS:
         if oob <= 18 and actual_pos >= 7:
-            lines = [
-                "Traffic trouble: needed more Out of the Box to find daylight.",
-                "Got bottled up—Out of the Box helps you cut through the pack.",
-            ]
-            reasons.append((0.75, RNG(hash64(seed, 'c_traffic', horse.id, race.name)).choice(lines)))
+            reasons.append((0.75, 'c_traffic', _TRAFFIC_LINES, None))
 
     # Front-runner fade hints
     if leg == "FR":
         if ten <= 18 and race.distance >= 1800:
-            lines = [
-                "Went forward early, but the finish asked for more Tenacious.",
-                "Led them up—and then the long run home bit back. Tenacious helps you hold.",
-            ]
-            reasons.append((0.60, RNG(hash64(seed, 'c_fade', horse.id, race.name)).choice(lines)))
+            reasons.append((0.60, 'c_fade', _FADE_LINES, None))
         if start <= 16:
-            lines = [
-                "Slow away from the gate—Start matters when you're meant to go forward.",
-                "Missed the jump. A front-runner wants a cleaner break.",
-            ]
-            reasons.append((0.55, RNG(hash64(seed, 'c_break', horse.id, race.name)).choice(lines)))
+            reasons.append((0.55, 'c_break', _BREAK_LINES, None))
 
     if not reasons:
         # Generic underperformance line
         rng = RNG(hash64(seed, "c_generic", horse.id, race.name))
-        return [
-            rng.choice(
-                [
-                    "Didn't find a rhythm today—sometimes it's just not their day.",
-                    "That one never got comfortable. Keep tuning the build and try again.",
-                    "A puzzling run—might have been the trip, might have been the day.",
-                ]
-            )
-        ]
-
-    # Pick the best reason (highest score), but keep deterministic ordering
-    reasons.sort(key=lambda x: x[0], reverse=True)
-    return [reasons[0][1]]
+        return [rng.choice(_GENERIC_LINES)]
+
+    # Pick the best reason (highest score; earliest wins ties)
+    _, salt, lines, fmt = max(reasons, key=lambda x: x[0])
+    line = RNG(hash64(seed, salt, horse.id, race.name)).choice(lines)
+    return [line.format(**fmt) if fmt else line]
+
+
+# Retirement poem banks (two poems per tier), keyed by tier.
+_LEGEND_POEMS = (
+    (
+        "A champion steps away from the rail,",
+        "and the crowd finally exhales.",
+        "From gate to wire, you answered every call—",
+        "the clock remembers your name.",
+        "Rest now. The field will chase your echo.",
+        "Tomorrow, a new hope is born.",
+    ),
+    (
+        "The banners come down slowly,",
+        "but the story stays.",
+        "You ran with steel in your stride,",
+        "and left the track a little quieter behind you.",
+        "Hold your head high in the paddock of legends.",
+        "The next generation is watching.",
+    ),
+)
+
+_STAR_POEMS = (
+    (
+        "Not every career is a crown—",
+        "some are a steady flame.",
+        "You found big moments under bright lights,",
+        "and proved you belonged.",
+        "Walk out proud. The barn knows what you did.",
+    ),
+    (
+        "A good horse leaves a mark",
+        "without needing a statue.",
+        "You showed heart when it counted,",
+        "and taught the stable to believe.",
+        "Retire with respect—and a full feed tub.",
+    ),
+)
+
+_FIGHTER_POEMS = (
+    (
+        "Some horses win by inches,",
+        "some by stubborn will.",
+        "You kept showing up,",
+        "and that matters.",
+        "Rest those legs—your work is done.",
+    ),
+    (
+        "No easy roads,",
+        "no easy fields.",
+        "But you fought for every length,",
+        "and earned your keep.",
+        "That's a career worth saluting.",
+    ),
+)
+
+_QUIET_POEMS = (
+    (
+        "The track doesn't love everyone loudly,",
+        "but it remembers the honest ones.",
+        "You tried. You learned. You ran.",
+        "That's enough for a good ending.",
+        "Rest now—your next chapter is quieter.",
+    ),
+    (
+        "Not every dream ends in a trophy,",
+        "but every run writes a line.",
+        "Thank you for the miles.",
+        "Thank you for the effort.",
+        "Time to come home.",
+    ),
+)
+
+_RETIRE_POEMS = {
+    "legend": _LEGEND_POEMS,
+    "star": _STAR_POEMS,
+    "fighter": _FIGHTER_POEMS,
+    "quiet": _QUIET_POEMS,
+}
 
 
 def retirement_poem_lines(seed: int, horse: Horse) -> List[str]:
@@ -336,87 +491,11 @@ def retirement_poem_lines(seed: int, horse: Horse) -> List[str]:
 
     rng = RNG(hash64(seed, "retire", horse.id, horse.name, tier))
 
-    legend = [
-        [
-            "A champion steps away from the rail,",
-            "and the crowd finally exhales.",
-            "From gate to wire, you answered every call—",
-            "the clock remembers your name.",
-            "Rest now. The field will chase your echo.",
-            "Tomorrow, a new hope is born.",
-        ],
-        [
-            "The banners come down slowly,",
-            "but the story stays.",
-            "You ran with steel in your stride,",
-            "and left the track a little quieter behind you.",
-            "Hold your head high in the paddock of legends.",
-            "The next generation is watching.",
-        ],
-    ]
-
-    star = [
-        [
-            "Not every career is a crown—",
-            "some are a steady flame.",
-            "You found big moments under bright lights,",
-            "and proved you belonged.",
-            "Walk out proud. The barn knows what you did.",
-        ],
-        [
-            "A good horse leaves a mark",
-            "without needing a statue.",
-            "You showed heart when it counted,",
-            "and taught the stable to believe.",
-            "Retire with respect—and a full feed tub.",
-        ],
-    ]
-
-    fighter = [
-        [
-            "Some horses win by inches,",
-            "some by stubborn will.",
-            "You kept showing up,",
-            "and that matters.",
-            "Rest those legs—your work is done.",
-        ],
-        [
-            "No easy roads,",
-            "no easy fields.",
-            "But you fought for every length,",
-            "and earned your keep.",
-            "That's a career worth saluting.",
-        ],
-    ]
-
-    quiet = [
-        [
-            "The track doesn't love everyone loudly,",
-            "but it remembers the honest ones.",
-            "You tried. You learned. You ran.",
-            "That's enough for a good ending.",
-            "Rest now—your next chapter is quieter.",
-        ],
-        [
-            "Not every dream ends in a trophy,",
-            "but every run writes a line.",
-            "Thank you for the miles.",
-            "Thank you for the effort.",
-            "Time to come home.",
-        ],
-    ]
-
-    bank = {
-        "legend": legend,
-        "star": star,
-        "fighter": fighter,
-        "quiet": quiet,
-    }[tier]
-
-    poem = rng.choice(bank)
+    poem = list(rng.choice(_RETIRE_POEMS[tier]))
     # Add a tiny stat-aware signature line.
+    earned = f"${earnings:,} earned"
     if g1 > 0:
-        poem = poem + [f"({g1} G1 win{'s' if g1 != 1 else ''} | ${earnings:,} earned)"]
+        poem.append(f"({g1} G1 win{'s' if g1 != 1 else ''} | {earned})")
     else:
-        poem = poem + [f"(${earnings:,} earned | {races} race{'s' if races != 1 else ''})"]
+        poem.append(f"({earned} | {races} race{'s' if races != 1 else ''})")
     return poem
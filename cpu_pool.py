@@ -1,7 +1,8 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Literal, Tuple
+from typing import Dict, List, Literal, Optional, Tuple
 
 from .rng import RNG, hash64
 from .models import Externals, Horse, Internals
@@ -27,6 +28,54 @@ class RoundPool:
     horses: List[Horse]
     sorted_ids: List[str]
     used_by_slot: Dict[Slot, set]
+    # Pool `rating_base` values in ascending order (for percentile lookups).
+    sorted_ratings: List[float] = field(default_factory=list)
+    # Horse lookup by id (filled in __post_init__ when not provided).
+    by_id: Dict[str, Horse] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.by_id:
+            self.by_id = {h.id: h for h in self.horses}
+
+
+@dataclass
+class HorsePool:
+    """CPU Horse objects reused from round to round.
+
+    Pass one to `build_round_pool` and it refills these horses in place
+    (see `_refill_horse`) instead of allocating a fresh field of 36 each
+    round. Horses from the previous round's pool must not be used after the
+    next round's pool is built.
+    """
+    horses: List[Horse] = field(default_factory=list)
+
+
+_HORSE_FIELDS = frozenset(f.name for f in fields(Horse))
+
+
+def _refill_horse(h: Horse, *, id: str, name: str, sex: str, style: str, ac: int,
+                  ints: Dict[str, int], ext: Dict[str, int]) -> None:
+    """Reset a pooled horse to the state a freshly built CPU horse would have."""
+    h.id = id
+    h.name = name
+    h.sex = sex
+    h.style = style
+    h.ac = ac
+    for k, v in ints.items():
+        setattr(h.internals, k, v)
+    for k, v in ext.items():
+        setattr(h.externals, k, v)
+    h.rating_base = None
+    h.genetic_tokens = 0
+    h.g1_wins = 0
+    h.pending_g1_superfood = False
+    h.career_log.clear()
+    h.last_training = None
+    h.last_feeding = None
+    h.extras.clear()
+    # Drop anything attached at runtime (caches, leg_type, ...).
+    for k in [k for k in vars(h) if k not in _HORSE_FIELDS]:
+        delattr(h, k)
 
 
 def count_player_wins(player: Horse) -> int:
@@ -34,19 +83,34 @@ def count_player_wins(player: Horse) -> int:
 
     We intentionally derive this from the persisted career log (rather than adding
     a new save field) so old saves remain compatible.
+
+    The count is cached on the horse as `_wins_cache` (not persisted); code that
+    appends a winning log entry should bump it via `note_player_finish`.
     """
 
-    wins = 0
-    for entry in getattr(player, "career_log", []) or []:
-        if getattr(entry, "player_pos", None) == 1:
-            wins += 1
+    cached = getattr(player, "_wins_cache", None)
+    if cached is not None:
+        return cached
+    wins = sum(1 for entry in (player.career_log or []) if entry.player_pos == 1)
+    player._wins_cache = wins
     return wins
 
 
-def player_rating_percentile(player: Horse, pool_horses: List[Horse]) -> float:
+def note_player_finish(player: Horse, pos: int) -> None:
+    """Keep the cached win count in sync after a race result is logged."""
+    if pos == 1 and getattr(player, "_wins_cache", None) is not None:
+        player._wins_cache += 1
+
+
+def player_rating_percentile(
+    player: Horse,
+    pool_horses: List[Horse],
+    sorted_ratings: Optional[List[float]] = None,
+) -> float:
     """Percentile rank of the player horse's rating within the current round pool.
 
     Returns a value in [0, 1]. Uses `rating_base` when present on pool horses.
+    Pass `RoundPool.sorted_ratings` to skip rebuilding the sorted rating list.
     """
 
     if not pool_horses:
@@ -55,21 +119,23 @@ def player_rating_percentile(player: Horse, pool_horses: List[Horse]) -> float:
     pool_int_mu, pool_int_sd = compute_pool_int_stats(pool_horses)
     pr = compute_rating(player, pool_int_mu, pool_int_sd)
 
-    ratings: List[float] = []
-    for h in pool_horses:
-        if getattr(h, "rating_base", None) is None:
-            ratings.append(compute_rating(h, pool_int_mu, pool_int_sd))
-        else:
-            ratings.append(float(h.rating_base))
-
-    if not ratings:
-        return 0.50
+    if not sorted_ratings:
+        sorted_ratings = sorted(
+            compute_rating(h, pool_int_mu, pool_int_sd)
+            if getattr(h, "rating_base", None) is None
+            else float(h.rating_base)
+            for h in pool_horses
+        )
 
-    le = sum(1 for r in ratings if r <= pr)
-    return le / float(len(ratings))
+    le = bisect_right(sorted_ratings, pr)
+    return le / float(len(sorted_ratings))
 
 
-def compute_1r_handicap_band_shift(player: Horse, pool_horses: List[Horse]) -> Tuple[float, int, float]:
+def compute_1r_handicap_band_shift(
+    player: Horse,
+    pool_horses: List[Horse],
+    sorted_ratings: Optional[List[float]] = None,
+) -> Tuple[float, int, float]:
     """Compute an additional band shift for slot 1R.
 
     Design intent:
@@ -82,7 +148,7 @@ def compute_1r_handicap_band_shift(player: Horse, pool_horses: List[Horse]) -> T
     """
 
     wins = count_player_wins(player)
-    pct = player_rating_percentile(player, pool_horses)
+    pct = player_rating_percentile(player, pool_horses, sorted_ratings)
 
     # Wins-driven scaling (primary). ~0.12 max.
     shift_wins = min(0.12, wins * 0.008)  # 10 wins => 0.08
@@ -107,14 +173,31 @@ def _scale_external(v: int, rm: float) -> int:
     scaled = mid + (v - mid) * rm
     return clamp_int(int(round(scaled)), 8, 48)
 
+def _scale_external_table(rm: float) -> List[int]:
+    """`_scale_external` for every birth value 8..48, indexed by the value itself."""
+    table = [0] * 49
+    for v in range(8, 49):
+        table[v] = _scale_external(v, rm)
+    return table
+
 def _scale_internals(i: Dict[str, int], rm: float) -> Dict[str, int]:
     mult = 0.95 + 0.05 * rm
     return {k: int(round(v * mult)) for k, v in i.items()}
 
-def build_round_pool(global_seed: int, round_num: int, sires, dams, data_dir: str, pool_size: int = 36) -> RoundPool:
+def build_round_pool(
+    global_seed: int,
+    round_num: int,
+    sires,
+    dams,
+    data_dir: str,
+    pool_size: int = 36,
+    horse_pool: Optional[HorsePool] = None,
+) -> RoundPool:
     seed = hash64(global_seed, "ROUND", round_num)
     rng = RNG(seed)
     rm = round_mean_multiplier(round_num)
+    # Birth externals are always 8..48, so scale each possible value once per round.
+    ext_scale = _scale_external_table(rm)
 
     # naming
     base_names = load_name_pool(Path(data_dir))
@@ -128,28 +211,48 @@ def build_round_pool(global_seed: int, round_num: int, sires, dams, data_dir: st
         ints = breed_internals(sire, dam)
         ac = breed_ac(sire, dam, rng)
 
-        ext2 = {k: _scale_external(ext[k], rm) for k in ext}
+        ext2 = {k: ext_scale[v] for k, v in ext.items()}
         ints2 = _scale_internals(ints, rm)
 
         style = derive_style_fr_sr(ext2)
 
-        horses.append(Horse(
-            id=f"CPU-R{round_num:02d}-{idx:02d}",
-            name=names[idx],
-            sex=rng.choice(["M", "F"]),
-            style=style,
-            ac=ac,
-            internals=Internals(**ints2),
-            externals=Externals(**ext2),
-        ))
+        hid = f"CPU-R{round_num:02d}-{idx:02d}"
+        sex = rng.choice(["M", "F"])
+        if horse_pool is not None and idx < len(horse_pool.horses):
+            h = horse_pool.horses[idx]
+            _refill_horse(h, id=hid, name=names[idx], sex=sex, style=style, ac=ac, ints=ints2, ext=ext2)
+        else:
+            h = Horse(
+                id=hid,
+                name=names[idx],
+                sex=sex,
+                style=style,
+                ac=ac,
+                internals=Internals(**ints2),
+                externals=Externals(**ext2),
+            )
+            if horse_pool is not None:
+                horse_pool.horses.append(h)
+        horses.append(h)
 
     mu, sd = compute_pool_int_stats(horses)
     for h in horses:
         h.rating_base = compute_rating(h, mu, sd)
 
-    sorted_ids = [h.id for h in sorted(horses, key=lambda x: float(x.rating_base or 0.0))]
+    # Decorate once (rating, pool index) instead of calling a key lambda per
+    # comparison; the index keeps ties in pool order like a stable sort.
+    keyed = sorted((float(h.rating_base or 0.0), i) for i, h in enumerate(horses))
+    sorted_ids = [horses[i].id for _, i in keyed]
+    sorted_ratings = [r for r, _ in keyed]
     used_by_slot = {slot: set() for slot in BANDS.keys()}
-    return RoundPool(round_num=round_num, seed=seed, horses=horses, sorted_ids=sorted_ids, used_by_slot=used_by_slot)
+    return RoundPool(
+        round_num=round_num,
+        seed=seed,
+        horses=horses,
+        sorted_ids=sorted_ids,
+        used_by_slot=used_by_slot,
+        sorted_ratings=sorted_ratings,
+    )
 
 def select_cpu_field(
     global_seed: int,
@@ -172,24 +275,23 @@ def select_cpu_field(
     candidates = ids[lo:hi+1]
 
     rng = RNG(hash64(global_seed, "FIELD", pool.round_num, slot, meet_iteration))
-    candidates = candidates[:]  # copy
-    rng.shuffle(candidates)
+    rng.shuffle(candidates)  # the slice above is already a fresh list
 
+    # One pass: take unused horses first, remembering already-used ones in
+    # shuffled order in case the band runs short.
     used = pool.used_by_slot[slot]
     chosen: List[str] = []
+    spill: List[str] = []
     for hid in candidates:
-        if hid not in used:
-            chosen.append(hid)
+        if hid in used:
+            spill.append(hid)
+            continue
+        chosen.append(hid)
         if len(chosen) == field_size:
             break
-
-    if len(chosen) < field_size:
-        for hid in candidates:
-            if hid not in chosen:
-                chosen.append(hid)
-            if len(chosen) == field_size:
-                break
+    else:
+        chosen.extend(spill[:field_size - len(chosen)])
 
     used.update(chosen)
-    m = {h.id: h for h in pool.horses}
+    m = pool.by_id
     return [m[i] for i in chosen if i in m]
@@ -1,6 +1,8 @@
 from __future__ import annotations
+import heapq
 from dataclasses import dataclass
-from typing import Dict, List, Literal, Tuple
+from functools import lru_cache
+from typing import Dict, List, Literal, Optional, Tuple
 
 from .models import FeedingResult, Horse
 from .rng import RNG, hash64
@@ -46,21 +48,36 @@ FOODS: List[FoodItem] = [
 ]
 
 SPECIAL_ORDER = ["Herbal Dumpling","Large Herbal Dumpling","Large Korean Ginseng"]
+_SPECIAL_ORDER_INDEX: Dict[str, int] = {name: i for i, name in enumerate(SPECIAL_ORDER)}
 
 PERFECT_ONLY = {"Draft Beer"}
 
+# Offering pools work on indices into FOODS: per-tier index tuples (catalog
+# order) are built once at import, and names are looked up only at the end.
+_FOOD_NAMES: Tuple[str, ...] = tuple(f.name for f in FOODS)
+_IDX_BY_TIER: Dict[str, Tuple[int, ...]] = {
+    tier: tuple(i for i, f in enumerate(FOODS) if f.tier == tier)
+    for tier in ("basic", "standard", "premium", "special")
+}
+_TIER_BY_NAME: Dict[str, str] = {f.name: f.tier for f in FOODS}
+# Premium pool outside PERFECT grades (PERFECT_ONLY foods removed).
+_PREMIUM_GATED_IDX: Tuple[int, ...] = tuple(i for i in _IDX_BY_TIER["premium"] if _FOOD_NAMES[i] not in PERFECT_ONLY)
+# Draft Beer's slot in the (ungated) premium pool, if it is in the catalog.
+_DRAFT_BEER_IDX: Optional[int] = next((i for i in _IDX_BY_TIER["premium"] if _FOOD_NAMES[i] == "Draft Beer"), None)
+
+# Diminishing returns (externals are clamped to 8..48).
+# Keep food meaningful through mid-career; taper close to cap:
+# magnitude is quartered from 46 and halved from 42 (never below 1).
+_DIMINISH_SHIFT: Tuple[int, ...] = tuple(2 if c >= 46 else 1 if c >= 42 else 0 for c in range(49))
+
 def _diminish(cur: int, delta: int) -> int:
     if delta == 0:
         return 0
-    mag = abs(delta)
-    sign = 1 if delta > 0 else -1
-    # Diminishing returns (externals are clamped to 8..48).
-    # Keep food meaningful through mid-career; taper close to cap.
-    if cur >= 46:
-        mag = max(1, mag // 4)
-    elif cur >= 42:
-        mag = max(1, mag // 2)
-    return sign * mag
+    shift = _DIMINISH_SHIFT[cur] if 0 <= cur <= 48 else (2 if cur >= 46 else 0)
+    mag = delta if delta > 0 else -delta
+    if shift:
+        mag = max(1, mag >> shift)
+    return mag if delta > 0 else -mag
 
 def _apply(player: Horse, deltas: Dict[str,int]) -> None:
     """Apply already-computed deltas to externals.
@@ -85,6 +102,31 @@ def unlocked_specials(player: Horse) -> List[str]:
     n = max(0, min(player.g1_wins, 3))
     return SPECIAL_ORDER[:n]
 
+def _bias_base(name: str, primary: Tuple[Stat,...]) -> float:
+    """Deterministic part of the food bias score (name heuristics vs primary stats)."""
+    n = name.lower()
+    score = 0.0
+    if "carrot" in n and ("start" in primary or "oob" in primary):
+        score += 2.0
+    if "apple" in n and ("spurt" in primary or "speed" in n):
+        score += 1.0
+    if "dumpling" in n and ("tenacious" in primary or "competing" in primary):
+        score += 1.5
+    if "cheese" in n and ("competing" in primary or "tenacious" in primary):
+        score += 1.0
+    if "mineral" in n and ("corner" in primary or "tenacious" in primary):
+        score += 1.0
+    return score
+
+# Deterministic bias score of every FOODS entry (by index), per primary tuple.
+_BIAS_CACHE: Dict[Tuple[Stat,...], Tuple[float, ...]] = {}
+
+def _bias_table(primary: Tuple[Stat,...]) -> Tuple[float, ...]:
+    table = _BIAS_CACHE.get(primary)
+    if table is None:
+        table = _BIAS_CACHE[primary] = tuple(_bias_base(n, primary) for n in _FOOD_NAMES)
+    return table
+
 def build_food_offering(
     global_seed: int,
     meet_iter: int,
@@ -98,106 +140,107 @@ def build_food_offering(
 ) -> List[str]:
     rng = RNG(hash64(global_seed, "FOOD_OFFER", round_num, slot, meet_iter))
 
-    # Some foods are intentionally gated behind specific contexts.
-    def gate_ok(f: FoodItem) -> bool:
-        if f.name in PERFECT_ONLY and grade != "Perfect":
-            return False
-        return True
-
-    # pool selection based on grade
-    unlocked = set(unlocked_specials(player))
-    basic = [f for f in FOODS if f.tier == "basic" and f.name not in unlocked and gate_ok(f)]
-    standard = [f for f in FOODS if f.tier == "standard" and f.name not in unlocked and gate_ok(f)]
-    premium = [f for f in FOODS if f.tier == "premium" and f.name not in unlocked and gate_ok(f)]
-    specials = [f for f in FOODS if f.name in unlocked and gate_ok(f)]
+    # pool selection based on grade (PERFECT_ONLY foods are gated to Perfect)
+    food_names = _FOOD_NAMES
+    unlocked = frozenset(unlocked_specials(player))
+    basic = _IDX_BY_TIER["basic"]
+    standard = _IDX_BY_TIER["standard"]
+    premium = _IDX_BY_TIER["premium"] if grade == "Perfect" else _PREMIUM_GATED_IDX
+    specials = [i for i in _IDX_BY_TIER["special"] if food_names[i] in unlocked]
 
     if grade == "Perfect":
-        pool = premium + standard + basic
+        pool = [*premium, *standard, *basic]
         bias_n = 4
     elif grade == "Cool":
-        pool = premium + standard + basic
+        pool = [*premium, *standard, *basic]
         bias_n = 3
     elif grade == "Great":
-        pool = premium + standard + basic
+        pool = [*premium, *standard, *basic]
         bias_n = 3
     elif grade == "Good" or grade == "None":
-        pool = standard + basic + premium
+        pool = [*standard, *basic, *premium]
         bias_n = 2
     else:
         # Bad: chaotic menu; still limited to unlocked specials if any
-        pool = basic + standard + premium
+        pool = [*basic, *standard, *premium]
         bias_n = 1
 
     rng.shuffle(pool)
 
-    chosen: List[FoodItem] = []
+    chosen: List[int] = []
+    chosen_set: set = set()
 
     # If training was PERFECT, always include the special "Draft Beer" option.
-    if grade == "Perfect":
-        beer = [f for f in premium if f.name == "Draft Beer"]
-        if beer:
-            chosen.append(beer[0])
+    if grade == "Perfect" and _DRAFT_BEER_IDX is not None:
+        chosen.append(_DRAFT_BEER_IDX)
+        chosen_set.add(_DRAFT_BEER_IDX)
 
     # include at most 1 special if available, to preserve "specialness"
     force_special = bool(specials) and getattr(player, "pending_g1_superfood", False) and slot == "1R"
     if force_special:
         # Use the highest-tier unlocked special for a clear reward.
-        best = max(specials, key=lambda f: SPECIAL_ORDER.index(f.name) if f.name in SPECIAL_ORDER else -1)
+        best = max(specials, key=lambda i: _SPECIAL_ORDER_INDEX.get(food_names[i], -1))
         chosen.append(best)
+        chosen_set.add(best)
     elif specials and grade in ("Perfect","Cool","Great","Good","None"):
         p = {"Perfect":0.60,"Cool":0.50,"Great":0.40,"Good":0.30,"None":0.30}.get(grade, 0.30)
         if rng.random() < p:
-            chosen.append(rng.choice(specials))
+            pick = rng.choice(specials)
+            chosen.append(pick)
+            chosen_set.add(pick)
 
     # bias selection: pick foods that "fit" primary/secondary by simple name heuristics
-    def bias_score(name: str) -> float:
-        n = name.lower()
-        score = 0.0
-        if "carrot" in n and ("start" in primary or "oob" in primary):
-            score += 2.0
-        if "apple" in n and ("spurt" in primary or "speed" in n):
-            score += 1.0
-        if "dumpling" in n and ("tenacious" in primary or "competing" in primary):
-            score += 1.5
-        if "cheese" in n and ("competing" in primary or "tenacious" in primary):
-            score += 1.0
-        if "mineral" in n and ("corner" in primary or "tenacious" in primary):
-            score += 1.0
-        return score + rng.random()*0.05
-
-    # pick biased items
-    remaining = [f for f in pool if f not in chosen]
-    remaining.sort(key=lambda f: bias_score(f.name), reverse=True)
-    for f in remaining[:bias_n]:
-        if f not in chosen:
-            chosen.append(f)
+    bias_base = _bias_table(tuple(primary))
+    rand = rng.random
+
+    def bias_score(i: int) -> float:
+        return bias_base[i] + rand()*0.05
+
+    # pick biased items (nlargest == sorted(..., reverse=True)[:n], with the
+    # jitter still drawn once per item in pool order)
+    remaining = [i for i in pool if i not in chosen_set]
+    for i in heapq.nlargest(bias_n, remaining, key=bias_score):
+        chosen.append(i)
+        chosen_set.add(i)
 
     # fill random
-    remaining2 = [f for f in pool if f not in chosen]
+    remaining2 = [i for i in pool if i not in chosen_set]
     rng.shuffle(remaining2)
-    for f in remaining2:
+    for i in remaining2:
         if len(chosen) >= k:
             break
-        chosen.append(f)
-
-    # ensure unique names
-    names = []
-    seen=set()
-    for f in chosen:
-        if f.name in seen:
-            continue
-        seen.add(f.name); names.append(f.name)
-        if len(names) == k:
-            break
+        chosen.append(i)
+
+    # names are unique by construction (every pick skips chosen_set)
+    names = [food_names[i] for i in chosen[:k]]
+    seen = set(names)
 
     # if still short, pad from standard/basic
-    pad_pool = [f.name for f in (standard+basic+premium) if f.name not in seen]
+    pad_pool = [food_names[i] for i in (*standard, *basic, *premium) if food_names[i] not in seen]
     rng.shuffle(pad_pool)
     while len(names) < k and pad_pool:
         names.append(pad_pool.pop())
 
     return names[:k]
 
+@lru_cache(maxsize=256)
+def _target_plan(prim: Tuple[Stat,...], sec: Tuple[Stat,...]) -> Tuple[Tuple[Stat,...], Tuple[Stat,...]]:
+    """(weighted target bag, non-target stats) for a primary/secondary pair.
+
+    The bag stays an expanded tuple (primaries x4, secondaries x2) rather than
+    weights + bisect: rng.choice over it is what seeded feedings replay.
+    """
+    weight_bag: List[Stat] = []
+    for s in prim:
+        weight_bag.extend([s] * 4)
+    for s in sec:
+        weight_bag.extend([s] * 2)
+    if not weight_bag:
+        weight_bag = list(EXTERNAL_KEYS)
+    target_set = set(weight_bag)
+    others = tuple(s for s in EXTERNAL_KEYS if s not in target_set)
+    return tuple(weight_bag), others
+
 def compute_food_deltas(seed, meet_iter, round_num, slot, grade: Grade, primary, secondary, chosen_food: str, player: Horse):
     rng = RNG(hash64(seed, "FOOD_DELTA", meet_iter, round_num, slot, chosen_food))
 
@@ -211,11 +254,7 @@ def compute_food_deltas(seed, meet_iter, round_num, slot, grade: Grade, primary,
     is_special = (chosen_food in SPECIAL_ORDER)
 
     # Determine food tier (basic/standard/premium/special/beer)
-    tier = "standard"
-    for it in FOODS:
-        if it.name == chosen_food:
-            tier = it.tier
-            break
+    tier = _TIER_BY_NAME.get(chosen_food, "standard")
     if is_beer:
         tier = "beer"
 
@@ -293,16 +332,7 @@ def compute_food_deltas(seed, meet_iter, round_num, slot, grade: Grade, primary,
         if applied:
             deltas[stat_name] = deltas.get(stat_name, 0) + applied
 
-    # Build weighted target bag (primaries dominate)
-    weight_bag = []
-    for s in prim_targets:
-        weight_bag.extend([s] * 4)
-    for s in sec_targets:
-        weight_bag.extend([s] * 2)
-    if not weight_bag:
-        weight_bag = list(EXTERNAL_KEYS)
-
-    target_set = set(weight_bag)
+    weight_bag, others = _target_plan(tuple(prim_targets), tuple(sec_targets))
     remaining = abs(budget)
     sign = 1 if budget > 0 else -1
 
@@ -331,7 +361,6 @@ def compute_food_deltas(seed, meet_iter, round_num, slot, grade: Grade, primary,
         remaining -= packet
 
     # Spillover to a non-target stat (helps runs feel DOC-like)
-    others = [s for s in EXTERNAL_KEYS if s not in target_set]
     if others:
         if tier in ("premium", "special", "beer"):
             p_other = 0.55
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+Stamp = Tuple[int, int]
+
+def file_stamp(path: Path) -> Optional[Stamp]:
+    """(st_mtime_ns, st_size) of `path`, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+class StampCache:
+    """Values derived from files, kept while the file's stamp is unchanged.
+
+    Holds at most `maxsize` keys; the least recently stored one is dropped first.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[Stamp, Any]] = {}
+
+    def get(self, key: Hashable, stamp: Optional[Stamp], default: Any = None) -> Any:
+        hit = self._data.get(key)
+        if stamp is None or hit is None or hit[0] != stamp:
+            return default
+        return hit[1]
+
+    def put(self, key: Hashable, stamp: Optional[Stamp], value: Any) -> None:
+        self._data.pop(key, None)
+        if stamp is None:
+            return
+        self._data[key] = (stamp, value)
+        if len(self._data) > self.maxsize:
+            del self._data[next(iter(self._data))]
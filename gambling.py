@@ -1,6 +1,8 @@
 from __future__ import annotations
 import math
+from bisect import bisect_left
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import Dict, List
 
 from .rng import RNG, hash64
@@ -17,10 +19,19 @@ class GamblingChanceResult:
 
 def softmax(scores: List[float], T: float) -> List[float]:
     mx = max(scores)
-    exps = [math.exp((s - mx) / T) for s in scores]
+    exp = math.exp
+    exps = [exp((s - mx) / T) for s in scores]
     Z = sum(exps)
     return [e / Z for e in exps]
 
+def _sample_index(ps: List[float], r: float) -> int:
+    """Index of the first running total of `ps` that reaches `r`.
+
+    Falls back to the last index if float rounding leaves the total just short of `r`.
+    """
+    i = bisect_left(list(accumulate(ps)), r)
+    return i if i < len(ps) else len(ps) - 1
+
 def run_gambling_chance(
     global_seed: int,
     meet_iteration: int,
@@ -36,23 +47,17 @@ def run_gambling_chance(
     rng = RNG(hash64(global_seed, "GAMBLE", round_num, slot, meet_iteration))
 
     ids = [h.id for h in cpu_field]
-    raw = [base_score(h, 1600) + rng.gauss(0.0, 2.0) + rng.gauss(0.0, 1.0) for h in cpu_field]
+    # Both noise terms stay separate draws: merging them into one N(0, sqrt(5))
+    # sample would shift the seeded stream and change every replayed meet.
+    gauss = rng.gauss
+    bases = [base_score(h, 1600) for h in cpu_field]
+    raw = [b + gauss(0.0, 2.0) + gauss(0.0, 1.0) for b in bases]
     ps = softmax(raw, temp)
 
-    odds: Dict[str, float] = {}
-    for hid, p in zip(ids, ps):
-        p = max(1e-6, p)
-        odds[hid] = (1.0 / p) * (1.0 - house_edge)
+    keep = 1.0 - house_edge
+    odds: Dict[str, float] = {hid: (1.0 / max(1e-6, p)) * keep for hid, p in zip(ids, ps)}
 
-    # sample winner
-    r = rng.random()
-    acc = 0.0
-    winner = ids[-1]
-    for hid, p in zip(ids, ps):
-        acc += p
-        if r <= acc:
-            winner = hid
-            break
+    winner = ids[_sample_index(ps, rng.random())]
 
     won = (picked_horse_id == winner)
     payout = 0
@@ -15,8 +15,10 @@ Ranking markers mirror the reference Excel sheet ("Horse Handicapping"):
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, List, Optional, Sequence
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
 
+from .commentary import expected_scores
 from .models import Horse
 from .schedule import RaceMeta
 
@@ -53,18 +55,53 @@ def _get_field(obj: Any, key: str, default: int = 0) -> int:
         return default
 
 
+def _stat_getter(group: str, key: str) -> Callable[[Horse], int]:
+    """Column getter for `h.<group>.<key>`.
+
+    Reads the attribute directly (the dataclass case) and only falls back to
+    `_get_field` for legacy dicts or missing/non-numeric values.
+    """
+    fast = attrgetter(f"{group}.{key}")
+
+    def get(h: Horse) -> int:
+        try:
+            return int(fast(h))
+        except Exception:
+            return _get_field(getattr(h, group), key)
+
+    return get
+
+
+_STAT_SPECS: Tuple[Tuple[str, str, str], ...] = (
+    ("stamina", "ST", "internals"),
+    ("speed", "SP", "internals"),
+    ("sharp", "SH", "internals"),
+    ("start", "Start", "externals"),
+    ("corner", "Corner", "externals"),
+    ("oob", "OOB", "externals"),
+    ("competing", "Comp", "externals"),
+    ("tenacious", "Ten", "externals"),
+    ("spurt", "Spurt", "externals"),
+)
+
 STAT_COLUMNS: List[StatColumn] = [
-    StatColumn("stamina", "ST", lambda h: _get_field(h.internals, "stamina")),
-    StatColumn("speed", "SP", lambda h: _get_field(h.internals, "speed")),
-    StatColumn("sharp", "SH", lambda h: _get_field(h.internals, "sharp")),
-    StatColumn("start", "Start", lambda h: _get_field(h.externals, "start")),
-    StatColumn("corner", "Corner", lambda h: _get_field(h.externals, "corner")),
-    StatColumn("oob", "OOB", lambda h: _get_field(h.externals, "oob")),
-    StatColumn("competing", "Comp", lambda h: _get_field(h.externals, "competing")),
-    StatColumn("tenacious", "Ten", lambda h: _get_field(h.externals, "tenacious")),
-    StatColumn("spurt", "Spurt", lambda h: _get_field(h.externals, "spurt")),
+    StatColumn(key, label, _stat_getter(group, key)) for key, label, group in _STAT_SPECS
 ]
 
+# All STAT_COLUMNS values of one horse in a single call (dataclass fast path).
+_ALL_STATS = attrgetter(*(f"{group}.{key}" for key, _, group in _STAT_SPECS))
+
+
+def _stat_columns(horses: Sequence[Horse]) -> List[Tuple[int, ...]]:
+    """Per-column stat values (STAT_COLUMNS order), reading each horse once."""
+    rows: List[Tuple[int, ...]] = []
+    for h in horses:
+        try:
+            rows.append(tuple(map(int, _ALL_STATS(h))))
+        except Exception:
+            rows.append(tuple(col.getter(h) for col in STAT_COLUMNS))
+    return list(zip(*rows))
+
 
 def _top_values(values: Sequence[int], k: int = 6) -> List[int]:
     """Return the k-th largest values (with duplicates), like Excel LARGE(range, k)."""
@@ -74,29 +111,38 @@ def _top_values(values: Sequence[int], k: int = 6) -> List[int]:
     return sorted_desc[: min(k, len(sorted_desc))]
 
 
-def _marker_for_value(v: int, top: Sequence[int]) -> str:
-    """Marker mapping mirroring the Excel 'Horse Handicapping' sheet."""
-    # Excel logic (per cell):
-    # IF(v=top1,"◎", IF(v=top2,"○", IF(v=top3,"▲", IF(v in top4..top6,"△",""))))
-    if len(top) >= 1 and v == top[0]:
-        return "◎"
-    if len(top) >= 2 and v == top[1]:
-        return "○"
-    if len(top) >= 3 and v == top[2]:
-        return "▲"
-    if len(top) >= 4 and v == top[3]:
-        return "△"
-    if len(top) >= 5 and v == top[4]:
-        return "△"
-    if len(top) >= 6 and v == top[5]:
-        return "△"
-    return ""
+# Marker by rank position in the top-6 list, mirroring the Excel
+# 'Horse Handicapping' sheet (per cell):
+# IF(v=top1,"◎", IF(v=top2,"○", IF(v=top3,"▲", IF(v in top4..top6,"△",""))))
+_RANK_MARKERS = ("◎", "○", "▲", "△", "△", "△")
+
+
+def _value_markers(vals: Sequence[int]) -> List[str]:
+    # A value takes the marker of the first top-6 slot it equals, so ties
+    # share the better marker (and push later values down, like LARGE()).
+    marker_by_val: dict[int, str] = {}
+    for v, mark in zip(_top_values(vals, k=6), _RANK_MARKERS):
+        marker_by_val.setdefault(v, mark)
+    return [marker_by_val.get(v, "") for v in vals]
 
 
-def _stat_markers(horses: Sequence[Horse], getter: Callable[[Horse], int]) -> List[str]:
-    vals = [int(getter(h)) for h in horses]
-    top = _top_values(vals, k=6)
-    return [_marker_for_value(v, top) for v in vals]
+def _fav_ranks(
+    horses: Sequence[Horse],
+    race: RaceMeta,
+    condition: str,
+    gate_by_id: dict[str, int] | None,
+    score_by_id: dict[str, float] | None = None,
+) -> dict[str, int]:
+    if score_by_id is None:
+        gates = [int(gate_by_id.get(h.id, i + 1)) if gate_by_id else (i + 1) for i, h in enumerate(horses)]
+        scores = expected_scores(horses, race, condition, gates)
+    else:
+        scores = [score_by_id[h.id] for h in horses]
+
+    scored: list[tuple[float, str]] = [(float(score), h.id) for h, score in zip(horses, scores)]
+
+    scored.sort(key=lambda t: t[0], reverse=True)
+    return {hid: rank for rank, (_, hid) in enumerate(scored, start=1)}
 
 
 def render_handicapping_table(
@@ -107,10 +153,12 @@ def render_handicapping_table(
     gate_by_id: dict[str, int] | None = None,
     race: Optional[RaceMeta] = None,
     condition: Optional[str] = None,
+    score_by_id: Optional[dict[str, float]] = None,
 ) -> str:
     """Render the pre-race handicapping preview.
 
-    The output is designed for a monospaced console.
+    The output is designed for a monospaced console. `score_by_id` takes
+    `expected_scores` already computed for these horses (by id).
     """
     if not horses:
         return ""
@@ -122,23 +170,13 @@ def render_handicapping_table(
 
     # Pre-compute markers per stat column.
     markers_by_col = {
-        col.key: _stat_markers(horses, col.getter) for col in STAT_COLUMNS
+        col.key: _value_markers(vals) for col, vals in zip(STAT_COLUMNS, _stat_columns(horses))
     }
 
     # "Favorite" (Fav) is an on-paper ranking for the upcoming race. This is informational only.
     fav_rank_by_id: dict[str, int] = {}
     if race is not None and condition is not None:
-        # Import lazily to avoid any startup overhead when the feature isn't used.
-        from .commentary import expected_score
-
-        scored: list[tuple[float, str]] = []
-        for i, h in enumerate(horses):
-            gate = int(gate_by_id.get(h.id, i + 1)) if gate_by_id else (i + 1)
-            scored.append((float(expected_score(h, race, condition, gate)), h.id))
-
-        scored.sort(key=lambda t: t[0], reverse=True)
-        for rank, (_, hid) in enumerate(scored, start=1):
-            fav_rank_by_id[hid] = rank
+        fav_rank_by_id = _fav_ranks(horses, race, condition, gate_by_id, score_by_id)
 
     gate_w = 4
     horse_w = 24
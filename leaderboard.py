@@ -2,12 +2,20 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
+from .file_cache import StampCache, file_stamp
 from .rng import RNG, hash64
 from .names import load_name_pool
 
+try:  # optional: faster parsing of save files on large installs
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _loads = json.loads
+
 
 @dataclass(frozen=True)
 class LeaderboardEntry:
@@ -28,49 +36,73 @@ def _safe_int(x, default: int = 0) -> int:
 
 def _load_state_file(path: Path) -> Optional[dict]:
     try:
-        return json.loads(path.read_text(encoding="utf-8", errors="ignore"))
+        data = path.read_bytes()
+    except Exception:
+        return None
+    try:
+        return _loads(data)
     except Exception:
+        pass
+    # Invalid UTF-8: keep the old lenient behavior (drop undecodable bytes).
+    try:
+        return json.loads(data.decode("utf-8", errors="ignore"))
+    except Exception:
+        return None
+
+
+# Parsed leaderboard entry per (path, source), kept while the file is
+# unchanged. None marks files that yield no entry.
+_LB_CACHE = StampCache()
+_MISSING = object()
+
+
+def _entry_from_file(p: Path, source: str) -> Optional[LeaderboardEntry]:
+    st = _load_state_file(p)
+    if not isinstance(st, dict):
+        return None
+    horse = st.get("player") if isinstance(st.get("player"), dict) else st.get("horse")
+    if not isinstance(horse, dict):
         return None
+    name = str(horse.get("name", "")).strip() or p.stem
+    sex = str(horse.get("sex", "?")).strip() or "?"
+    earnings = _safe_int(st.get("earnings", 0))
+    races = _safe_int(st.get("races_run", 0))
+    g1 = _safe_int(st.get("g1_wins", 0))
+    return LeaderboardEntry(
+        name=name,
+        sex=sex,
+        earnings=max(0, earnings),
+        races=max(0, races),
+        g1_wins=max(0, g1),
+        source=source,
+    )
 
 
 def collect_player_entries(save_dir: Path, retired_dir: Path) -> List[LeaderboardEntry]:
-    entries: List[LeaderboardEntry] = []
+    # Deduplicate by name+sex as files are scanned, keeping the max earnings.
+    best: dict[tuple[str, str], LeaderboardEntry] = {}
 
     def scan_dir(d: Path, source: str) -> None:
         if not d.exists():
             return
         for p in sorted(d.glob("*.json")):
-            st = _load_state_file(p)
-            if not isinstance(st, dict):
+            stamp = file_stamp(p)
+            if stamp is None:
                 continue
-            horse = st.get("player") if isinstance(st.get("player"), dict) else st.get("horse")
-            if not isinstance(horse, dict):
+            key = (str(p), source)
+            e = _LB_CACHE.get(key, stamp, _MISSING)
+            if e is _MISSING:
+                e = _entry_from_file(p, source)
+                _LB_CACHE.put(key, stamp, e)
+            if e is None:
                 continue
-            name = str(horse.get("name", "")).strip() or p.stem
-            sex = str(horse.get("sex", "?")).strip() or "?"
-            earnings = _safe_int(st.get("earnings", 0))
-            races = _safe_int(st.get("races_run", 0))
-            g1 = _safe_int(st.get("g1_wins", 0))
-            entries.append(
-                LeaderboardEntry(
-                    name=name,
-                    sex=sex,
-                    earnings=max(0, earnings),
-                    races=max(0, races),
-                    g1_wins=max(0, g1),
-                    source=source,
-                )
-            )
+            k = (e.name, e.sex)
+            cur = best.get(k)
+            if cur is None or e.earnings > cur.earnings:
+                best[k] = e
 
     scan_dir(save_dir, "PLAYER")
     scan_dir(retired_dir, "RETIRED")
-
-    # Deduplicate by name+sex, keeping the max earnings.
-    best: dict[tuple[str, str], LeaderboardEntry] = {}
-    for e in entries:
-        k = (e.name, e.sex)
-        if k not in best or e.earnings > best[k].earnings:
-            best[k] = e
     return list(best.values())
 
 
@@ -107,7 +139,9 @@ def top_earnings_leaderboard(
     """Return (title, entries) for the leaderboard display."""
     players = collect_player_entries(save_dir, retired_dir)
     if players:
-        players.sort(key=lambda e: (-e.earnings, e.name))
+        # Two stable passes == key (-earnings, name), without building tuple keys.
+        players.sort(key=attrgetter("name"))
+        players.sort(key=attrgetter("earnings"), reverse=True)
         return ("Leaderboard (Top Earnings)", players[:limit])
     # No player horses yet -> show CPU hall of fame.
     cpu = generate_cpu_hof(seed=seed, data_dir=data_dir, n=limit)
@@ -120,15 +154,13 @@ def render_leaderboard(title: str, entries: Iterable[LeaderboardEntry]) -> str:
         return f"{title}\n\n(No horses yet.)\n"
 
     # Column widths
-    name_w = max(10, min(26, max(len(e.name) for e in rows)))
+    name_w = max(10, min(26, max(map(len, (e.name for e in rows)))))
     lines: List[str] = []
     lines.append("=" * 28)
     lines.append(title)
     lines.append("=" * 28)
     lines.append(f"{'#':>2}  {'Horse':<{name_w}}  {'Sex':<3}  {'Earnings':>12}")
     lines.append(f"{'-'*2}  {'-'*name_w}  {'-'*3}  {'-'*12}")
-    for i, e in enumerate(rows, start=1):
-        lines.append(
-            f"{i:>2}  {e.name:<{name_w}}  {e.sex:<3}  ${e.earnings:>11,}"
-        )
+    row_fmt = f"{{:>2}}  {{:<{name_w}}}  {{:<3}}  ${{:>11,}}".format
+    lines.extend(row_fmt(i, e.name, e.sex, e.earnings) for i, e in enumerate(rows, start=1))
     return "\n".join(lines)
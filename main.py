@@ -3,8 +3,12 @@ import argparse
 import os
 import re
 import sys
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from . import __version__
 from .rng import RNG, hash64
@@ -12,9 +16,9 @@ from .roster import ParentHorse, load_roster_from_breeder_html
 from .breeding import breed_internals, breed_ac, compute_birth_ext_8_48_from_parents, derive_leg_type, clamp_int
 from .models import Externals, Horse, Internals, RaceLogEntry
 from .schedule import SCHEDULE as BASE_SCHEDULE, RaceMeta
-from .cpu_pool import build_round_pool, select_cpu_field, compute_1r_handicap_band_shift
+from .cpu_pool import HorsePool, build_round_pool, select_cpu_field, compute_1r_handicap_band_shift, note_player_finish
 from .handicapping import render_handicapping_table
-from .commentary import birth_comment, expected_score, race_insight_lines, retirement_poem_lines
+from .commentary import birth_comment, expected_scores, race_insight_lines, retirement_poem_lines
 from .race_engine import draw_gates, run_race_sim
 from .race_reporting import timed_results, render_race_card, format_time
 from .gambling import run_gambling_chance
@@ -24,6 +28,7 @@ from .progression import apply_post_race_growth, apply_g1_win_rewards
 from .records import load_records, save_records, reset_records, record_surfaces_map
 from .surfaces import enrich_schedule_with_codes_and_surfaces, roll_condition
 from .save_load import save_game, load_game, horse_to_dict, horse_from_dict
+from .file_cache import Stamp, StampCache, file_stamp
 from .raw_export import export_state_to_raw_files, ensure_horse_extras
 from .msr_export import export_state_to_msr206u_raw, ensure_msr_extras
 from .leaderboard import render_leaderboard, top_earnings_leaderboard
@@ -31,6 +36,70 @@ from .world import WorldState, load_world_state, save_world_state, reset_world_s
 
 G1_GATE = 1_000_000
 
+# Breeding-card external keys. Pedigree ext data stays a dict on disk (see
+# save_load), so readers check for the full key set in one comparison.
+_EXT_KEYS = ("start", "corner", "oob", "competing", "tenacious", "spurt")
+_EXT_KEY_SET = frozenset(_EXT_KEYS)
+_EXT_VALUES = attrgetter(*_EXT_KEYS)
+
+# safe_filename patterns
+_RE_FS_BAD = re.compile(r'[<>:"/\\|?*]+')
+_RE_WS = re.compile(r"\s+")
+_RE_UND = re.compile(r"_+")
+
+
+def _json_files(d: Path) -> List[Path]:
+    """Same entries as sorted(d.glob("*.json")), from one scandir pass (empty if `d` is missing)."""
+    try:
+        with os.scandir(d) as it:
+            paths = [d / e.name for e in it if os.path.normcase(e.name).endswith(".json")]
+    except OSError:
+        return []
+    paths.sort()
+    return paths
+
+
+def _next_free_json(d: Path, stem: str, reuse: Optional[Path] = None) -> Path:
+    """First of d/<stem>.json, d/<stem>_2.json, ... not already taken.
+
+    Lists `d` once instead of stat()ing each candidate. Names are compared
+    case-insensitively so a case-insensitive filesystem (Windows, macOS)
+    never hands back an existing file. A taken name that resolves to `reuse`
+    counts as free.
+    """
+    try:
+        with os.scandir(d) as it:
+            taken = {e.name.casefold() for e in it}
+    except OSError:
+        taken = set()
+    reuse_resolved = reuse.resolve() if reuse is not None else None
+    name = f"{stem}.json"
+    n = 2
+    while True:
+        p = d / name
+        if name.casefold() not in taken or (reuse_resolved is not None and p.resolve() == reuse_resolved):
+            return p
+        name = f"{stem}_{n}.json"
+        n += 1
+
+
+def _saved_world_pointer(state: dict) -> Optional[Tuple[int, int, int]]:
+    """(cycle, current_round, race_index) checkpointed in a save, if valid.
+
+    Older saves carry no race_index (their world entry was written before the
+    pointer advanced), so they yield None and world_state stays authoritative.
+    """
+    w = state.get("world")
+    if not isinstance(w, dict) or "race_index" not in w:
+        return None
+    try:
+        cycle, current_round, race_index = int(w["cycle"]), int(w["current_round"]), int(w["race_index"])
+    except Exception:
+        return None
+    if cycle < 0 or not 1 <= current_round <= 16 or not 0 <= race_index <= 5:
+        return None
+    return cycle, current_round, race_index
+
 
 def _clear_screen() -> None:
     """Best-effort terminal clear for a cleaner 'splash' main menu."""
@@ -40,6 +109,12 @@ def _clear_screen() -> None:
         pass
 
 
+def _write_lines(lines: List[str]) -> None:
+    """Write whole screens in one go (same output as one print() per line)."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def print_splash() -> None:
     """Print a simple terminal splash screen (homage; not a logo replica)."""
     _clear_screen()
@@ -52,21 +127,23 @@ def print_splash() -> None:
   ╚═════╝  ╚═════╝  ╚═════╝╚══════╝╚═╝╚═╝     ╚═╝
 """.rstrip("\n")
 
-    print(art)
-    print(f"\n  DOCSim — Derby Owners Club Simulation Program  (v{__version__})")
-    print("  World Edition  |  text-based homage")
-    print("  " + ("=" * 54) + "\n")
+    _write_lines([
+        art,
+        f"\n  DOCSim — Derby Owners Club Simulation Program  (v{__version__})",
+        "  World Edition  |  text-based homage",
+        "  " + ("=" * 54) + "\n",
+    ])
 
 
 def safe_filename(name: str) -> str:
     """Return a filesystem-safe stem for save files."""
     s = name.strip()
     # Replace characters that are problematic on Windows filesystems.
-    s = re.sub(r'[<>:"/\\|?*]+', "_", s)
+    s = _RE_FS_BAD.sub("_", s)
     # Collapse whitespace to underscores
-    s = re.sub(r"\s+", "_", s)
+    s = _RE_WS.sub("_", s)
     # Keep it tidy
-    s = re.sub(r"_+", "_", s).strip("._ ")
+    s = _RE_UND.sub("_", s).strip("._ ")
     return s if s else "horse"
 
 def prompt_int(prompt: str, lo: int, hi: int) -> int:
@@ -86,32 +163,38 @@ def prompt_choice(prompt: str, options: List[str]) -> int:
     return prompt_int("Select: ", 1, len(options)) - 1
 
 
+_LEG_TYPE_LABELS = {
+    "FR": "Front-runner",
+    "SD": "Start Dash",
+    "LS": "Last Spurt",
+    "SR": "Stretch-runner",
+    "AL": "Almighty",
+}
+
 def leg_type_label(code: str) -> str:
-    return {
-        "FR": "Front-runner",
-        "SD": "Start Dash",
-        "LS": "Last Spurt",
-        "SR": "Stretch-runner",
-        "AL": "Almighty",
-    }.get(code, code)
+    return _LEG_TYPE_LABELS.get(code, code)
 
 def stable_card(player: Horse, deltas: dict | None = None) -> None:
+    print(stable_card_line(player, deltas))
+
+# Stable card layout: "START 30 | CORNER 28 | OOB  25 | ..." (labels padded to 4).
+_STABLE_LABELS = tuple(f"{k.upper():<4}" for k in _EXT_KEYS)
+_STABLE_TMPL = " | ".join(label + " {:>2}" for label in _STABLE_LABELS)
+
+def stable_card_line(player: Horse, deltas: dict | None = None) -> str:
     e = player.externals
-    def fmt(stat: str, val: int) -> str:
-        if deltas and stat in deltas and deltas[stat]:
-            d = deltas[stat]
+    vals = (e.start, e.corner, e.oob, e.competing, e.tenacious, e.spurt)
+    if not deltas:
+        return _STABLE_TMPL.format(*vals)
+    parts = []
+    for stat, label, val in zip(_EXT_KEYS, _STABLE_LABELS, vals):
+        d = deltas.get(stat)
+        if d:
             sign = "+" if d > 0 else ""
-            return f"{stat.upper():<4} {val:>2} ({sign}{d})"
-        return f"{stat.upper():<4} {val:>2}"
-    parts = [
-        fmt("start", e.start),
-        fmt("corner", e.corner),
-        fmt("oob", e.oob),
-        fmt("competing", e.competing),
-        fmt("tenacious", e.tenacious),
-        fmt("spurt", e.spurt),
-    ]
-    print(" | ".join(parts))
+            parts.append(f"{label} {val:>2} ({sign}{d})")
+        else:
+            parts.append(f"{label} {val:>2}")
+    return " | ".join(parts)
 
 def display_parent(h) -> str:
     return f"{h.name} | INT {h.stamina}/{h.speed}/{h.sharp} | AC {h.ac} | EXT {h.start},{h.corner},{h.oob},{h.competing},{h.tenacious},{h.spurt}"
@@ -125,24 +208,38 @@ def render_parent_pick_table(parents: list[ParentHorse]) -> str:
 
     name_w = min(28, max(16, max(len(p.name) for p in parents)))
 
-    header = (
-        f"{'#':>2}  {'Horse':<{name_w}}  {'INT':>9}  {'AC':>4}  "
-        f"{'Start':>5} {'Corner':>6} {'OOB':>4} {'Comp':>4} {'Ten':>3} {'Spurt':>5}"
-    )
-    sep = "-" * len(header)
-    rows = [header, sep]
+    # One row template (header included) with the name width baked in.
+    row_fmt = (
+        f"{{:>2}}  {{:<{name_w}}}  {{:>9}}  {{:>4}}  "
+        "{:>5} {:>6} {:>4} {:>4} {:>3} {:>5}"
+    ).format
+    header = row_fmt("#", "Horse", "INT", "AC", "Start", "Corner", "OOB", "Comp", "Ten", "Spurt")
+    rows = [header, "-" * len(header)]
     for i, p in enumerate(parents, start=1):
-        int_txt = f"{int(p.stamina):d}/{int(p.speed):d}/{int(p.sharp):d}"
-        rows.append(
-            f"{i:>2}  {p.name:<{name_w}}  {int_txt:>9}  {int(p.ac):>4}  "
-            f"{int(p.start):>5} {int(p.corner):>6} {int(p.oob):>4} {int(p.competing):>4} {int(p.tenacious):>3} {int(p.spurt):>5}"
-        )
+        rows.append(row_fmt(
+            i, p.name, f"{int(p.stamina):d}/{int(p.speed):d}/{int(p.sharp):d}", int(p.ac),
+            int(p.start), int(p.corner), int(p.oob), int(p.competing), int(p.tenacious), int(p.spurt),
+        ))
     return "\n".join(rows)
 
 
-def _ext_8_48_to_0_16(v: int) -> int:
-    """Convert in-career external scale (8..48) back to breeder-scale (0..16)."""
-    return clamp_int(int(round(((int(v) - 8) / 40.0) * 16.0)), 0, 16)
+def _ext_8_48_to_0_16_calc(v: int) -> int:
+    return clamp_int(int(round(((v - 8) / 40.0) * 16.0)), 0, 16)
+
+
+# _ext_8_48_to_0_16_calc for every in-range value, indexed by the value itself.
+_EXT_8_48_TO_0_16 = tuple(_ext_8_48_to_0_16_calc(v) for v in range(49))
+
+
+def _ext_8_48_to_0_16_all(ext: Externals) -> List[int]:
+    """Convert all six externals from in-career scale (8..48) back to
+    breeder-scale (0..16), in _EXT_KEYS order."""
+    table = _EXT_8_48_TO_0_16
+    out = []
+    for v in _EXT_VALUES(ext):
+        v = int(v)
+        out.append(table[v] if 0 <= v <= 48 else _ext_8_48_to_0_16_calc(v))
+    return out
 
 
 def _parent_from_retired(h: Horse) -> ParentHorse:
@@ -151,20 +248,14 @@ def _parent_from_retired(h: Horse) -> ParentHorse:
     # when available. If missing (older saves), fall back to converting the
     # trained 8..48 externals.
     be = getattr(h, "breeding_ext", None)
-    if isinstance(be, dict) and all(k in be for k in ("start", "corner", "oob", "competing", "tenacious", "spurt")):
-        start = clamp_int(int(be["start"]), 0, 16)
-        corner = clamp_int(int(be["corner"]), 0, 16)
-        oob = clamp_int(int(be["oob"]), 0, 16)
-        competing = clamp_int(int(be["competing"]), 0, 16)
-        tenacious = clamp_int(int(be["tenacious"]), 0, 16)
-        spurt = clamp_int(int(be["spurt"]), 0, 16)
+    if isinstance(be, dict) and be.keys() >= _EXT_KEY_SET:
+        # Clamp to the 0..16 card range inline (one pass, no per-key calls).
+        vals = [int(be[k]) for k in _EXT_KEYS]
+        start, corner, oob, competing, tenacious, spurt = [
+            0 if v < 0 else 16 if v > 16 else v for v in vals
+        ]
     else:
-        start = _ext_8_48_to_0_16(h.externals.start)
-        corner = _ext_8_48_to_0_16(h.externals.corner)
-        oob = _ext_8_48_to_0_16(h.externals.oob)
-        competing = _ext_8_48_to_0_16(h.externals.competing)
-        tenacious = _ext_8_48_to_0_16(h.externals.tenacious)
-        spurt = _ext_8_48_to_0_16(h.externals.spurt)
+        start, corner, oob, competing, tenacious, spurt = _ext_8_48_to_0_16_all(h.externals)
 
     return ParentHorse(
         name=h.name,
@@ -181,30 +272,86 @@ def _parent_from_retired(h: Horse) -> ParentHorse:
     )
 
 
-def _load_retired_candidates(retired_dir: Path) -> List[dict]:
-    """Load retired horses that can be used as breeding parents."""
-    out: List[dict] = []
+def _retired_parent(h: Horse) -> ParentHorse:
+    """`_parent_from_retired` for a horse from the retired-candidate cache.
+
+    Cached horses are never modified (a changed file is reloaded as a new
+    Horse), so the frozen ParentHorse is kept on the horse as `_parent_cache`
+    (not persisted).
+    """
+    cached = getattr(h, "_parent_cache", None)
+    if cached is None:
+        cached = h._parent_cache = _parent_from_retired(h)
+    return cached
+
+
+# Parsed retired-candidate entry per file, kept while the file is unchanged
+# so it is not re-read on every breeding menu. None marks files that could
+# not be loaded.
+_RETIRED_CACHE = StampCache()
+_MISSING = object()
+
+
+def _load_retired_entry(p: Path) -> Optional[dict]:
+    try:
+        state = load_game(p)
+        if not state:
+            return None
+        h = horse_from_dict(state.get("player", {}))
+        return {
+            "path": p,
+            "horse": h,
+            "earnings": int(state.get("earnings", 0)),
+            "races_run": int(state.get("races_run", 0)),
+            "g1_wins": int(getattr(h, "g1_wins", 0)),
+            "tokens": int(getattr(h, "genetic_tokens", 0)),
+        }
+    except Exception:
+        return None
+
+
+def _load_retired_candidates(retired_dir: Path) -> Tuple[List[dict], List[dict]]:
+    """Load retired horses that can be used as breeding parents.
+
+    Returns (stallions, mares), each in file-name order.
+    """
+    stallions: List[dict] = []
+    mares: List[dict] = []
     if not retired_dir.exists():
-        return out
-    for p in sorted(retired_dir.glob("*.json")):
-        try:
-            state = load_game(str(p))
-            if not state:
-                continue
-            h = horse_from_dict(state.get("player", {}))
-            out.append(
-                {
-                    "path": p,
-                    "horse": h,
-                    "earnings": int(state.get("earnings", 0)),
-                    "races_run": int(state.get("races_run", 0)),
-                    "g1_wins": int(getattr(h, "g1_wins", 0)),
-                    "tokens": int(getattr(h, "genetic_tokens", 0)),
-                }
-            )
-        except Exception:
+        return stallions, mares
+
+    entries: List[Optional[dict]] = []
+    stale: List[Tuple[int, Path, Stamp]] = []  # (index into entries, path, stamp)
+    for p in _json_files(retired_dir):
+        stamp = file_stamp(p)
+        if stamp is None:
             continue
-    return out
+        entry = _RETIRED_CACHE.get(p, stamp, _MISSING)
+        if entry is _MISSING:
+            stale.append((len(entries), p, stamp))
+            entry = None
+        entries.append(entry)
+
+    # Overlap file reads when several saves need (re)loading.
+    stale_paths = [p for _, p, _ in stale]
+    if len(stale_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale_paths))) as ex:
+            loaded = list(ex.map(_load_retired_entry, stale_paths))
+    else:
+        loaded = [_load_retired_entry(p) for p in stale_paths]
+    for (i, p, stamp), entry in zip(stale, loaded):
+        _RETIRED_CACHE.put(p, stamp, entry)
+        entries[i] = entry
+
+    for entry in entries:
+        if entry is None:
+            continue
+        sex = entry["horse"].sex
+        if sex == "M":
+            stallions.append(dict(entry))
+        elif sex == "F":
+            mares.append(dict(entry))
+    return stallions, mares
 
 
 def create_player_horse(seed: int, sires, dams, rev: str, retired_dir: Path) -> Horse:
@@ -212,9 +359,7 @@ def create_player_horse(seed: int, sires, dams, rev: str, retired_dir: Path) ->
     sires_pick = rng.sample(sires, 10)
     dams_pick = rng.sample(dams, 10)
 
-    retired = _load_retired_candidates(retired_dir)
-    retired_stallions = [r for r in retired if r["horse"].sex == "M"]
-    retired_mares = [r for r in retired if r["horse"].sex == "F"]
+    retired_stallions, retired_mares = _load_retired_candidates(retired_dir)
 
     # --- Sire selection ---
     print("\n=== Choose your Sire (10) ===")
@@ -235,7 +380,7 @@ def create_player_horse(seed: int, sires, dams, rev: str, retired_dir: Path) ->
             )
         pick = prompt_int("Pick retired sire (1-{0}): ".format(len(retired_stallions)), 1, len(retired_stallions)) - 1
         sire_h = retired_stallions[pick]["horse"]
-        sire = _parent_from_retired(sire_h)
+        sire = _retired_parent(sire_h)
         sire_tokens = int(getattr(sire_h, "genetic_tokens", 0))
     else:
         sire = sires_pick[prompt_int("Pick sire (1-10): ", 1, 10) - 1]
@@ -259,7 +404,7 @@ def create_player_horse(seed: int, sires, dams, rev: str, retired_dir: Path) ->
             )
         pick = prompt_int("Pick retired dam (1-{0}): ".format(len(retired_mares)), 1, len(retired_mares)) - 1
         dam_h = retired_mares[pick]["horse"]
-        dam = _parent_from_retired(dam_h)
+        dam = _retired_parent(dam_h)
         dam_tokens = int(getattr(dam_h, "genetic_tokens", 0))
     else:
         dam = dams_pick[prompt_int("Pick dam (1-10): ", 1, 10) - 1]
@@ -410,40 +555,41 @@ def _breeding_card_ext_0_16(h: Horse) -> Dict[str, int]:
       2) h.sire_ext + h.dam_ext (compute floor average)
       3) fallback: convert current race externals 8..48 -> 0..16-ish
     """
-    keys = ("start", "corner", "oob", "competing", "tenacious", "spurt")
+    keys = _EXT_KEYS
 
     be = getattr(h, "breeding_ext", None)
-    if isinstance(be, dict) and all(k in be for k in keys):
-        out = {k: int(be[k]) for k in keys}
-        return out
+    if isinstance(be, dict) and be.keys() >= _EXT_KEY_SET:
+        return {k: int(be[k]) for k in keys}
 
     se = getattr(h, "sire_ext", None)
     de = getattr(h, "dam_ext", None)
-    if isinstance(se, dict) and isinstance(de, dict) and all(k in se and k in de for k in keys):
-        out = {k: (int(se[k]) + int(de[k])) // 2 for k in keys}
-        return out
+    if isinstance(se, dict) and isinstance(de, dict) and se.keys() >= _EXT_KEY_SET and de.keys() >= _EXT_KEY_SET:
+        return {k: (int(se[k]) + int(de[k])) // 2 for k in keys}
 
     # Fallback: derive something reasonable from trained stats.
-    return {
-        "start": _ext_8_48_to_0_16(h.externals.start),
-        "corner": _ext_8_48_to_0_16(h.externals.corner),
-        "oob": _ext_8_48_to_0_16(h.externals.oob),
-        "competing": _ext_8_48_to_0_16(h.externals.competing),
-        "tenacious": _ext_8_48_to_0_16(h.externals.tenacious),
-        "spurt": _ext_8_48_to_0_16(h.externals.spurt),
-    }
+    return dict(zip(keys, _ext_8_48_to_0_16_all(h.externals)))
+
+
+# Legacy tiers, lowest first, with the earnings / G1-win thresholds that reach them.
+_RETIRE_TIERS = (("△", "Quiet"), ("▲", "Fighter"), ("○", "Star"), ("◎", "Legend"))
+_RETIRE_EARNINGS_STEPS = (750_000, 2_500_000, 5_000_000)
+_RETIRE_G1_STEPS = (1, 3)
+_RETIRE_G1_TIER = (0, 2, 3)
 
 
 def retirement_tier_label(*, earnings: int, g1_wins: int) -> Tuple[str, str]:
     """A simple legacy tier used in the retirement screen."""
     # Heavier weight on G1 wins, with an earnings fallback.
-    if g1_wins >= 3 or earnings >= 5_000_000:
-        return "◎", "Legend"
-    if g1_wins >= 1 or earnings >= 2_500_000:
-        return "○", "Star"
-    if earnings >= 750_000:
-        return "▲", "Fighter"
-    return "△", "Quiet"
+    tier = max(
+        _RETIRE_G1_TIER[bisect_right(_RETIRE_G1_STEPS, g1_wins)],
+        bisect_right(_RETIRE_EARNINGS_STEPS, earnings),
+    )
+    return _RETIRE_TIERS[tier]
+
+
+# Breeding-card symbols from worst to best, split at these values.
+_BREEDING_SYMBOL_STEPS = (6, 9, 12)
+_BREEDING_SYMBOLS = ("△", "▲", "○", "◎")
 
 
 def _symbol_for_breeding_value(v: int) -> str:
@@ -455,13 +601,20 @@ def _symbol_for_breeding_value(v: int) -> str:
         n = int(v)
     except Exception:
         n = 0
-    if n >= 12:
-        return "◎"
-    if n >= 9:
-        return "○"
-    if n >= 6:
-        return "▲"
-    return "△"
+    return _BREEDING_SYMBOLS[bisect_right(_BREEDING_SYMBOL_STEPS, n)]
+
+
+# _symbol_for_breeding_value for every on-card value 0..16.
+_BREEDING_SYMBOL_BY_VALUE = tuple(_symbol_for_breeding_value(n) for n in range(17))
+
+
+def _breeding_card_symbols(ext: Dict[str, int]) -> Dict[str, str]:
+    """Symbol per breeding-card stat; on-card ints are a plain table lookup."""
+    table = _BREEDING_SYMBOL_BY_VALUE
+    return {
+        k: table[v] if type(v) is int and 0 <= v <= 16 else _symbol_for_breeding_value(v)
+        for k, v in ext.items()
+    }
 
 
 def retirement_screen(seed: int, player: Horse, earnings: int, races_run: int) -> None:
@@ -469,75 +622,126 @@ def retirement_screen(seed: int, player: Horse, earnings: int, races_run: int) -
     _clear_screen()
 
     # Text and poem
-    print("Dam reg.")
-    print("=" * 62)
-    print(f"{player.name} has finished its racing career...")
-    print("Dam reg. and is")
-    print("now ready to retire to the breeding farm.")
-    print()
+    out: List[str] = [
+        "Dam reg.",
+        "=" * 62,
+        f"{player.name} has finished its racing career...",
+        "Dam reg. and is",
+        "now ready to retire to the breeding farm.",
+        "",
+    ]
 
     g1_wins = int(getattr(player, "g1_wins", 0))
     tier_sym, tier_label = retirement_tier_label(earnings=earnings, g1_wins=g1_wins)
-    print(f"Legacy: {tier_sym} {tier_label}")
+    out.append(f"Legacy: {tier_sym} {tier_label}")
 
     poem = retirement_poem_lines(seed, player)
     if poem:
-        for line in poem:
-            print(line)
-        print()
+        out.extend(poem)
+        out.append("")
 
     # Stats block
     internal_type = _internal_type_label(player)
     ext = _breeding_card_ext_0_16(player)
-    sym = {k: _symbol_for_breeding_value(ext.get(k, 0)) for k in ext}
+    sym = _breeding_card_symbols(ext)
 
-    print(f"{internal_type:>54}")
-    print("".ljust(62, "-"))
-    print(f"Earnings: ${earnings:,}  |  Races: {races_run}  |  G1 wins: {g1_wins}  |  Tokens: {int(getattr(player, 'genetic_tokens', 0))}")
-    print(f"Internals ST/SP/SH: {player.internals.stamina}/{player.internals.speed}/{player.internals.sharp}")
-    print()
+    out.append(f"{internal_type:>54}")
+    out.append("".ljust(62, "-"))
+    out.append(f"Earnings: ${earnings:,}  |  Races: {races_run}  |  G1 wins: {g1_wins}  |  Tokens: {int(getattr(player, 'genetic_tokens', 0))}")
+    out.append(f"Internals ST/SP/SH: {player.internals.stamina}/{player.internals.speed}/{player.internals.sharp}")
+    out.append("")
     if getattr(player, "sire_name", None) or getattr(player, "dam_name", None):
         sire_name = getattr(player, "sire_name", "?")
         dam_name = getattr(player, "dam_name", "?")
-        print(f"Sire: {sire_name}  |  Dam: {dam_name}")
-        print()
+        out.append(f"Sire: {sire_name}  |  Dam: {dam_name}")
+        out.append("")
+
+    out.append("Breeding Card (externals)")
+    out.append("START".ljust(14) + sym.get("start", "△"))
+    out.append("CORNER".ljust(14) + sym.get("corner", "△"))
+    out.append("OUT OF BOX".ljust(14) + sym.get("oob", "△"))
+    out.append("COMPETING".ljust(14) + sym.get("competing", "△"))
+    out.append("TENACIOUS".ljust(14) + sym.get("tenacious", "△"))
+    out.append("SPURT".ljust(14) + sym.get("spurt", "△"))
+    out.append("")
+
+    out.append("Final Trained Externals")
+    out.append(stable_card_line(player))
+    out.append("")
+    out.append("Do not leave Dam reg. card.")
+    _write_lines(out)
+    input("Press Enter to continue...")
 
-    print("Breeding Card (externals)")
-    print("START".ljust(14) + sym.get("start", "△"))
-    print("CORNER".ljust(14) + sym.get("corner", "△"))
-    print("OUT OF BOX".ljust(14) + sym.get("oob", "△"))
-    print("COMPETING".ljust(14) + sym.get("competing", "△"))
-    print("TENACIOUS".ljust(14) + sym.get("tenacious", "△"))
-    print("SPURT".ljust(14) + sym.get("spurt", "△"))
-    print()
+# Export picker rows per file, kept while the file is unchanged; see _export_picker_row.
+_EXPORT_ROW_CACHE = StampCache()
+
+
+def _export_picker_row(p: Path) -> Tuple[bool, Optional[tuple]]:
+    """(loadable, (name, sex, earnings, races_run) or None) for one save file.
+
+    Unloadable files are left out of the picker; loadable files whose horse
+    cannot be rebuilt keep their number but print no row.
+    """
+    stamp = file_stamp(p)
+    if stamp is None:
+        return (False, None)
+    hit = _EXPORT_ROW_CACHE.get(p, stamp)
+    if hit is not None:
+        return hit
+
+    try:
+        state = load_game(p)
+    except Exception:
+        result: Tuple[bool, Optional[tuple]] = (False, None)
+    else:
+        try:
+            h = horse_from_dict(state.get("player", {}))
+            row = (h.name, h.sex, int(state.get("earnings", 0) or 0), int(state.get("races_run", 0) or 0))
+        except Exception:
+            row = None
+        result = (True, row)
+    _EXPORT_ROW_CACHE.put(p, stamp, result)
+    return result
+
+
+# Load-menu summary line per save file, kept while the file is unchanged.
+_SAVE_SUMMARY_CACHE = StampCache()
+
+
+def _save_summary(p: Path) -> str:
+    """Load-menu line for one save; reparsed only when the file changes."""
+    stamp = file_stamp(p)
+    hit = _SAVE_SUMMARY_CACHE.get(p, stamp)
+    if hit is not None:
+        return hit
+
+    summary = p.stem
+    st = load_game(p)
+    if st and isinstance(st, dict) and st.get("player"):
+        try:
+            h = horse_from_dict(st["player"])
+            e = int(st.get("earnings", 0))
+            r = int(st.get("races_run", 0))
+            retired_flag = bool(st.get("retired", False))
+            suffix = " [Retired]" if retired_flag else ""
+            summary = f"{h.name} ({h.sex}) | ${e:,} | Races {r}{suffix}"
+        except Exception:
+            pass
+    _SAVE_SUMMARY_CACHE.put(p, stamp, summary)
+    return summary
 
-    print("Final Trained Externals")
-    stable_card(player)
-    print()
-    print("Do not leave Dam reg. card.")
-    input("Press Enter to continue...")
 
 def export_saved_horse_menu(save_dir: Path, retired_dir: Path, export_dir: Path) -> None:
     # Ensure output folder exists
     export_dir.mkdir(parents=True, exist_ok=True)
 
-    candidates = []  # list[(path, label, state)]
-
-    if save_dir.exists():
-        for p in sorted(save_dir.glob("*.json")):
-            try:
-                st = load_game(p)
-                candidates.append((p, "SAVE", st))
-            except Exception:
-                continue
+    candidates: List[Tuple[Path, str, Optional[tuple]]] = []  # (path, label, picker row)
 
-    if retired_dir.exists():
-        for p in sorted(retired_dir.glob("*.json")):
-            try:
-                st = load_game(p)
-                candidates.append((p, "RETIRED", st))
-            except Exception:
-                continue
+    for d, label in ((save_dir, "SAVE"), (retired_dir, "RETIRED")):
+        for p in _json_files(d):
+            loaded, row = _export_picker_row(p)
+            if loaded:
+                candidates.append((p, label, row))
 
     if not candidates:
         print()
@@ -546,14 +750,11 @@ def export_saved_horse_menu(save_dir: Path, retired_dir: Path, export_dir: Path)
 
     print()
     print("=== Export a Saved Horse ===")
-    for i, (_p, label, st) in enumerate(candidates, start=1):
-        try:
-            h = horse_from_dict(st.get("player", {}))
-        except Exception:
+    for i, (_p, label, row) in enumerate(candidates, start=1):
+        if row is None:
             continue
-        earnings = int(st.get("earnings", 0) or 0)
-        races_run = int(st.get("races_run", 0) or 0)
-        print(f"  {i}. {h.name} ({h.sex}) | ${earnings:,} | Races {races_run} [{label}]")
+        name, sex, earnings, races_run = row
+        print(f"  {i}. {name} ({sex}) | ${earnings:,} | Races {races_run} [{label}]")
 
     choice = input("Pick a save number, or press Enter to cancel: ").strip()
     if not choice:
@@ -569,7 +770,13 @@ def export_saved_horse_menu(save_dir: Path, retired_dir: Path, export_dir: Path)
         print("Invalid selection.")
         return
 
-    st = candidates[idx][2]
+    # Only the picked file is loaded in full.
+    try:
+        st = load_game(candidates[idx][0])
+    except Exception as e:
+        print()
+        print(f"Export failed: {e}")
+        return
 
     print()
     print("Choose export format:")
@@ -605,46 +812,107 @@ def export_saved_horse_menu(save_dir: Path, retired_dir: Path, export_dir: Path)
         print(f"  MSR206u:  {msr_path}")
 
 
-def main() -> None:
+# schedule enrichment: per-(round, slot) surface overrides
+_SURFACE_OVERRIDES = {
+    (1,"G1"): "DIRT",  # Winter Stakes (DOC community schedule marks this as Dirt in many guides)
+    (9,"G1"): "DIRT",  # Super Dirt GP
+    (14,"G1"): "DIRT", # Japan Cup Dirt
+}
+
+
+@lru_cache(maxsize=4)
+def _enriched_schedule_rounds(record_surfaces_key: frozenset) -> Tuple[Tuple[RaceMeta, ...], ...]:
+    record_surfaces = {k: list(v) for k, v in record_surfaces_key}
+    rounds = enrich_schedule_with_codes_and_surfaces(BASE_SCHEDULE, record_surfaces, _SURFACE_OVERRIDES)
+    return tuple(tuple(r) for r in rounds)
+
+
+def _enriched_schedule(record_surfaces_key: frozenset) -> List[List[RaceMeta]]:
+    """BASE_SCHEDULE with course codes/surfaces, memoized per record-surface set."""
+    return [list(r) for r in _enriched_schedule_rounds(record_surfaces_key)]
+
+
+# Command-line defaults, shared by the parser and the bare-launch fast path.
+_ARG_DEFAULTS = {
+    "seed": 0,
+    "rev": "revC",
+    "breeder_html": None,
+    "max_rounds": 1,
+    "debug": False,
+    "save": None,
+    "save_dir": str(Path("saves")),
+    "data_dir": str(Path("data")),
+    "load": None,
+    "reset_records": False,
+    "records_state": str(Path("data")/"records_state.json"),
+    "records_default": str(Path("data")/"records_default.json"),
+    "world_state": str(Path("data") / "world_state.json"),
+    "reset_world": False,
+    "retired_dir": str(Path("retired")),
+    "export_dir": str(Path("exports")),
+    "batch": False,
+}
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser()
-    ap.add_argument("--seed", type=int, default=0)
-    ap.add_argument("--rev", type=str, default="revC", choices=["revA","revB","revC","revD"])
-    ap.add_argument("--breeder-html", type=str, default=None, help="Path to DOC_Horse_Breeder_Lite_RevC_RevD.html")
-    ap.add_argument("--max-rounds", type=int, default=1, help="How many rounds to play this run (1..16).")
+    ap.add_argument("--seed", type=int, default=_ARG_DEFAULTS["seed"])
+    ap.add_argument("--rev", type=str, default=_ARG_DEFAULTS["rev"], choices=["revA","revB","revC","revD"])
+    ap.add_argument("--breeder-html", type=str, default=_ARG_DEFAULTS["breeder_html"], help="Path to DOC_Horse_Breeder_Lite_RevC_RevD.html")
+    ap.add_argument("--max-rounds", type=int, default=_ARG_DEFAULTS["max_rounds"], help="How many rounds to play this run (1..16).")
     ap.add_argument("--debug", action="store_true")
-    ap.add_argument("--save", type=str, default=None, help="Save file path (.json). If omitted, defaults to saves/<horse_name>.json or continues the loaded save file.")
-    ap.add_argument("--save-dir", type=str, default=str(Path("saves")), help="Directory to store autosaves when --save is not provided.")
+    ap.add_argument("--save", type=str, default=_ARG_DEFAULTS["save"], help="Save file path (.json). If omitted, defaults to saves/<horse_name>.json or continues the loaded save file.")
+    ap.add_argument("--save-dir", type=str, default=_ARG_DEFAULTS["save_dir"], help="Directory to store autosaves when --save is not provided.")
     ap.add_argument(
         "--data-dir",
         type=str,
-        default=str(Path("data")),
+        default=_ARG_DEFAULTS["data_dir"],
         help="Directory containing static data files (e.g., cpu_names.json, records defaults).",
     )
-    ap.add_argument("--load", type=str, default=None)
+    ap.add_argument("--load", type=str, default=_ARG_DEFAULTS["load"])
     ap.add_argument("--reset-records", action="store_true")
-    ap.add_argument("--records-state", type=str, default=str(Path("data")/"records_state.json"))
-    ap.add_argument("--records-default", type=str, default=str(Path("data")/"records_default.json"))
+    ap.add_argument("--records-state", type=str, default=_ARG_DEFAULTS["records_state"])
+    ap.add_argument("--records-default", type=str, default=_ARG_DEFAULTS["records_default"])
     ap.add_argument(
         "--world-state",
         type=str,
-        default=str(Path("data") / "world_state.json"),
-        help="Path to persistent world race-program state (advances across horses).",
+        default=_ARG_DEFAULTS["world_state"],
+        help=(
+            "Path to persistent world race-program state (advances across horses). "
+            "Updated at round boundaries and on quit; mid-round progress is kept in the horse's save."
+        ),
     )
     ap.add_argument("--reset-world", action="store_true", help="Reset the world race program back to Round 1.")
     ap.add_argument(
         "--retired-dir",
         type=str,
-        default=str(Path("retired")),
+        default=_ARG_DEFAULTS["retired_dir"],
         help="Directory where retired horses are stored for breeding.",
     )
     ap.add_argument(
         "--export-dir",
         type=str,
-        default=str(Path("exports")),
+        default=_ARG_DEFAULTS["export_dir"],
         help="Directory where exported .raw files are written.",
     )
+    ap.add_argument(
+        "--batch",
+        action="store_true",
+        help="Skip the optional menus and between-round prompts, as when input is not a terminal (scripted runs).",
+    )
+
+    return ap
+
 
-    args = ap.parse_args()
+def main() -> None:
+    # A bare launch (no flags) is the common interactive case; skip building
+    # the parser and start from the defaults.
+    if len(sys.argv) <= 1:
+        args = argparse.Namespace(**_ARG_DEFAULTS)
+    else:
+        args = _build_arg_parser().parse_args()
+    # Optional prompts only make sense at a terminal; checked once per run.
+    interactive = sys.stdin.isatty() and not args.batch
 
     # seed=0 means "random" (still printed so the run can be reproduced)
     if args.seed == 0:
@@ -680,12 +948,7 @@ def main() -> None:
     retired_dir.mkdir(parents=True, exist_ok=True)
 
     # schedule enrichment
-    explicit_overrides = {
-        (1,"G1"): "DIRT",  # Winter Stakes (DOC community schedule marks this as Dirt in many guides)
-        (9,"G1"): "DIRT",  # Super Dirt GP
-        (14,"G1"): "DIRT", # Japan Cup Dirt
-    }
-    schedule = enrich_schedule_with_codes_and_surfaces(BASE_SCHEDULE, record_surfaces, explicit_overrides)
+    schedule = _enriched_schedule(frozenset((k, tuple(v)) for k, v in record_surfaces.items()))
 
     # load game if requested
     earnings = 0
@@ -701,7 +964,7 @@ def main() -> None:
 
     # Main menu (interactive only).
     # This keeps the core flow intact while exposing extra utilities (e.g., Leaderboard).
-    if args.load is None and sys.stdin.isatty():
+    if args.load is None and interactive:
         while True:
             print_splash()
             print("=== Main Menu ===")
@@ -733,7 +996,7 @@ def main() -> None:
                 return
 
     # Optional interactive load menu (if --load not provided)
-    if args.load is None and sys.stdin.isatty():
+    if args.load is None and interactive:
         while True:
             choice = input("Start (N)ew horse or (L)oad save? [N]: ").strip().lower()
             if not choice or choice.startswith("n"):
@@ -741,26 +1004,14 @@ def main() -> None:
             if not choice.startswith("l"):
                 break
 
-            saves = sorted(save_dir.glob("*.json"))
+            saves = _json_files(save_dir)
             if not saves:
                 print(f"No save files found in {save_dir}. Starting a new horse.")
                 break
 
             print("\n=== Load a Saved Horse ===")
             for idx, p in enumerate(saves, start=1):
-                summary = p.stem
-                st = load_game(p)
-                if st and isinstance(st, dict) and st.get("player"):
-                    try:
-                        h = horse_from_dict(st["player"])
-                        e = int(st.get("earnings", 0))
-                        r = int(st.get("races_run", 0))
-                        retired_flag = bool(st.get("retired", False))
-                        suffix = " [Retired]" if retired_flag else ""
-                        summary = f"{h.name} ({h.sex}) | ${e:,} | Races {r}{suffix}"
-                    except Exception:
-                        pass
-                print(f" {idx}. {summary}")
+                print(f" {idx}. {_save_summary(p)}")
 
             sel = input(f"Pick save (1-{len(saves)}), or press Enter to cancel: ").strip()
             if not sel:
@@ -803,6 +1054,12 @@ def main() -> None:
             races_run = int(state.get("races_run", 0))
             meet_iter = int(state.get("meet_iter", 1))
             start_round = int(state.get("round_num", 1))
+            # Mid-round, the world pointer is checkpointed in this save rather
+            # than world_state (see the race loop); pick it up if it is ahead.
+            saved_world = _saved_world_pointer(state)
+            if saved_world is not None and saved_world > (world.cycle, world.current_round, world.race_index):
+                world.cycle, world.current_round, world.race_index = saved_world
+                save_world_state(world_state_path, world)
             # Respect the global race program: the world never goes backwards.
             if start_round < world.current_round:
                 start_round = world.current_round
@@ -823,17 +1080,15 @@ def main() -> None:
         start_round = world.current_round
         player = create_player_horse(args.seed, sires, dams, args.rev, retired_dir)
 
+    # The player's name is fixed from here on; derive its file stem once.
+    player_stem = safe_filename(player.name)
+
     # Decide save file path
     if args.save:
         save_path = Path(args.save)
     elif save_path is None:
         save_dir.mkdir(parents=True, exist_ok=True)
-        stem = safe_filename(player.name)
-        save_path = save_dir / f"{stem}.json"
-        n = 2
-        while save_path.exists():
-            save_path = save_dir / f"{stem}_{n}.json"
-            n += 1
+        save_path = _next_free_json(save_dir, player_stem)
 
     print(f"(Save file: {save_path})")
 
@@ -853,27 +1108,26 @@ def main() -> None:
             "races_run": races_run,
             "retired": retired_flag,
             "retired_reason": retired_reason,
+            # Includes the full career_log on every save: it is only ever
+            # rebuilt from here on load, and the 1R handicap (win count) and
+            # MSR export read it. Unchanged entries are not re-converted.
             "player": horse_to_dict(player),
-            # Convenience for players who manage multiple horses
-            "world": {"current_round": world.current_round, "cycle": world.cycle},
+            # Convenience for players who manage multiple horses; also the
+            # mid-round checkpoint of the world pointer.
+            "world": {"current_round": world.current_round, "cycle": world.cycle, "race_index": world.race_index},
         }
 
-    def save_now(next_round: int) -> dict:
+    def save_now(next_round: int, durable: bool = False) -> dict:
         st = _build_state(next_round)
-        save_game(save_path, st)
+        save_game(save_path, st, durable=durable)
         return st
 
     def archive_retired_copy(st: dict) -> None:
         """Write a copy of the final state into retired/ for breeding."""
         try:
             retired_dir.mkdir(parents=True, exist_ok=True)
-            base = safe_filename(player.name) or "retired_horse"
-            target = retired_dir / f"{base}.json"
-            n = 2
-            while target.exists() and target.resolve() != save_path.resolve():
-                target = retired_dir / f"{base}_{n}.json"
-                n += 1
-            save_game(target, st)
+            target = _next_free_json(retired_dir, player_stem, reuse=save_path)
+            save_game(target, st, durable=True)
             print(f"(Retired horse archived: {target})")
         except Exception as e:
             print(f"(Warning: could not archive retired horse: {e})")
@@ -883,25 +1137,19 @@ def main() -> None:
 
     rounds_to_play = max(1, min(args.max_rounds, 16))
     current_round = start_round
+    cpu_horses = HorsePool()  # CPU opponents, refilled in place each round
 
     for _ in range(rounds_to_play):
-        if sys.stdin.isatty():
+        if interactive:
             cmd = input(f"\nNext up: ROUND {current_round}. Press Enter to play, or (Q)uit: ").strip().lower()
             if cmd.startswith("q"):
                 break
 
         print(f"\n====================\nROUND {current_round}\n====================")
-        pool = build_round_pool(args.seed, current_round, sires, dams, data_dir="data", pool_size=36)
+        pool = build_round_pool(args.seed, current_round, sires, dams, data_dir="data", pool_size=36, horse_pool=cpu_horses)
 
         round_earnings_start = earnings
-        round_stat_start = (
-            player.externals.start,
-            player.externals.corner,
-            player.externals.oob,
-            player.externals.competing,
-            player.externals.tenacious,
-            player.externals.spurt,
-        )
+        round_stat_start = _EXT_VALUES(player.externals)  # snapshot, _EXT_KEYS order
         best_finish_this_round = 99
         best_race_name = ""
         stop_after_round = False
@@ -955,7 +1203,9 @@ def main() -> None:
             one_r_wins = 0
             one_r_pct = 0.0
             if race.slot == "1R":
-                one_r_shift, one_r_wins, one_r_pct = compute_1r_handicap_band_shift(player, pool.horses)
+                one_r_shift, one_r_wins, one_r_pct = compute_1r_handicap_band_shift(
+                    player, pool.horses, pool.sorted_ratings
+                )
                 band_shift += one_r_shift
 
             # G1 gate
@@ -963,7 +1213,7 @@ def main() -> None:
                 print(f"G1 entry requires ${G1_GATE:,}. You have ${earnings:,}.")
                 q = input("Press Enter to run Gambling Chance, or (Q)uit & save: ").strip().lower()
                 if q.startswith("q"):
-                    save_now(current_round)
+                    save_now(current_round, durable=True)
                     save_world_state(world_state_path, world)
                     print("Saved. You can load another horse and continue from this race.")
                     return
@@ -978,8 +1228,9 @@ def main() -> None:
                 pick_id = cpu12[pick_idx].id
                 res = run_gambling_chance(args.seed, world_iter, race.round_num, race.slot, cpu12, pick_id)
 
-                winner_name = next(h.name for h in cpu12 if h.id == res.winner_horse_id)
-                picked_name = next(h.name for h in cpu12 if h.id == res.picked_horse_id)
+                name_by_id = {h.id: h.name for h in cpu12}
+                winner_name = name_by_id[res.winner_horse_id]
+                picked_name = name_by_id[res.picked_horse_id]
                 print(f"Winner: {winner_name} | Your pick: {picked_name}")
                 if res.won:
                     print(f"You won ${res.payout:,}!")
@@ -987,15 +1238,13 @@ def main() -> None:
                 else:
                     print("No payout.")
 
-                # Save progress (still within the current round)
-                save_now(current_round)
-
-                # Advance global program pointer
+                # Advance global program pointer, then save progress (still
+                # within the current round); world_state is written at round end.
                 if race_idx >= len(round_schedule) - 1:
                     world = advance_world_round(world, 1)
                 else:
                     world.race_index = race_idx + 1
-                save_world_state(world_state_path, world)
+                save_now(current_round)
 
                 continue
 
@@ -1012,14 +1261,21 @@ def main() -> None:
                     f"1R Handicap: field strength +{one_r_shift:.2f} "
                     f"(Wins: {one_r_wins} | Power: {pct_txt} pct)"
                 )
-            runners = [player] + cpu11
+            runners = [player, *cpu11]
             gate_by_id = draw_gates(args.seed, world_iter, race, condition, runners)
+            # On-paper scores, shared by the preview's Fav column and the
+            # post-race expected rank.
+            score_by_id = dict(zip(
+                [h.id for h in runners],
+                expected_scores(runners, race, condition, [int(gate_by_id.get(h.id, 1)) for h in runners]),
+            ))
             print(
                 render_handicapping_table(
                     runners,
                     gate_by_id=gate_by_id,
                     race=race,
                     condition=condition,
+                    score_by_id=score_by_id,
                 )
             )
             # Final confirmation (with quit+save) before results are generated.
@@ -1027,7 +1283,7 @@ def main() -> None:
             print(f"Track condition: {condition}")
             cmd = input("Enter race? (Enter to run, S to skip, Q to quit & save): ").strip().lower()
             if cmd.startswith("q"):
-                save_now(current_round)
+                save_now(current_round, durable=True)
                 save_world_state(world_state_path, world)
                 print("Saved. You can load another horse and continue from this race.")
                 return
@@ -1046,10 +1302,12 @@ def main() -> None:
                 save_world_state(world_state_path, world)
                 break
 
-            # Expected rank (on paper), used for post-race commentary only
-            expected_scores = {h.id: expected_score(h, race, condition, int(gate_by_id.get(h.id, 1))) for h in runners}
-            expected_order = sorted(expected_scores.items(), key=lambda kv: kv[1], reverse=True)
-            expected_rank = 1 + next((i for i,(hid,_) in enumerate(expected_order) if hid == player.id), len(expected_order))
+            # Expected rank (on paper), used for post-race commentary only;
+            # race_insight_lines calls this only when the finish needs it.
+            def expected_rank() -> int:
+                expected_order = sorted(score_by_id.items(), key=lambda kv: kv[1], reverse=True)
+                return 1 + next((i for i,(hid,_) in enumerate(expected_order) if hid == player.id), len(expected_order))
+
             sim = run_race_sim(args.seed, world_iter, race, condition, player, cpu11, gate_by_id=gate_by_id)
 
             timed = timed_results(race, condition, sim.finish_order, sim.scores, records)
@@ -1059,7 +1317,8 @@ def main() -> None:
             print(render_race_card(race, condition, timed, sim.payouts_by_pos))
 
             # determine player's place in timed results
-            player_row = next(rr for rr in timed.runners if rr.horse_id == player.id)
+            rows_by_id = {rr.horse_id: rr for rr in timed.runners}
+            player_row = rows_by_id[player.id]
             pos = player_row.pos
 
             payout = sim.payouts_by_pos.get(pos, 0)
@@ -1132,20 +1391,25 @@ def main() -> None:
                 field=timed.runners
             )
             player.career_log.append(entry)
+            note_player_finish(player, pos)
 
-            # persist records if changed
-            save_records(records_state_path, records)
+            # persist records if changed (or not yet written for this state file)
+            if timed.records_changed or not records_state_path.exists():
+                save_records(records_state_path, records)
 
-            # Save progress after each race (but keep the same round number so
-            # an unexpected exit doesn't skip ahead).
-            save_now(current_round)
-
-            # Advance global program pointer (race-by-race) so other horses can join mid-round.
+            # Advance the global program pointer race by race. Mid-round it is
+            # checkpointed only in this horse's save (below); world_state
+            # catches up at the round boundary or on quit/skip, so a different
+            # horse started meanwhile joins at the last round boundary, while
+            # reloading this save resumes at the exact race.
             if race_idx >= len(round_schedule) - 1:
                 world = advance_world_round(world, 1)
             else:
                 world.race_index = race_idx + 1
-            save_world_state(world_state_path, world)
+
+            # Save progress after each race (but keep the same round number so
+            # an unexpected exit doesn't skip ahead).
+            save_now(current_round)
 
             if races_run >= 64:
                 retired_flag = True
@@ -1154,18 +1418,19 @@ def main() -> None:
                 stop_after_round = True
                 break
 
+        save_world_state(world_state_path, world)
+
         # Round summary
         round_earnings = earnings - round_earnings_start
-        round_stat_end = (player.externals.start, player.externals.corner, player.externals.oob, player.externals.competing, player.externals.tenacious, player.externals.spurt)
-        delta_stats = tuple(e - s for s,e in zip(round_stat_start, round_stat_end))
+        round_stat_end = _EXT_VALUES(player.externals)
         print("\n=== Round Summary ===")
         print(f"Round {current_round} earnings: ${round_earnings:,} | Best finish: {best_finish_this_round} ({best_race_name})")
         print("External changes this round:")
-        deltas = {"start":delta_stats[0],"corner":delta_stats[1],"oob":delta_stats[2],"competing":delta_stats[3],"tenacious":delta_stats[4],"spurt":delta_stats[5]}
+        deltas = {k: e - s for k, s, e in zip(_EXT_KEYS, round_stat_start, round_stat_end)}
         stable_card(player, deltas)
 
         # Optional retirement prompt between rounds (less spammy than per-race)
-        if (not retired_flag) and races_run >= 20 and sys.stdin.isatty():
+        if (not retired_flag) and races_run >= 20 and interactive:
             ans = input("You may retire now. Retire horse? (y/N): ").strip().lower()
             if ans.startswith("y"):
                 retired_flag = True
@@ -1180,7 +1445,7 @@ def main() -> None:
         if next_round > 16:
             next_round = 1
 
-        st_final = save_now(next_round)
+        st_final = save_now(next_round, durable=True)
 
         # Archive retired horses for breeding
         if retired_flag:
@@ -7,13 +7,13 @@ Sex = Literal["M","F"]
 Surface = Literal["TURF","DIRT"]
 Condition = Literal["GOOD","GOOD_TO_SOFT","SOFT","HEAVY"]
 
-@dataclass
+@dataclass(slots=True)
 class Internals:
     stamina: int
     speed: int
     sharp: int
 
-@dataclass
+@dataclass(slots=True)
 class Externals:
     start: int
     corner: int
@@ -22,14 +22,14 @@ class Externals:
     tenacious: int
     spurt: int
 
-@dataclass
+@dataclass(slots=True)
 class TrainingResult:
     training_id: int
     training_name: str
     grade: Literal["Perfect","Cool","Great","Good","Bad","None"]
     deltas: Dict[str,int]
 
-@dataclass
+@dataclass(slots=True)
 class FeedingResult:
     grade_context: Literal["Perfect","Cool","Great","Good","Bad","None"]
     foods_offered: List[str]
@@ -37,7 +37,7 @@ class FeedingResult:
     deltas: Dict[str,int]
     notes: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class RaceRunnerResult:
     pos: int
     horse_id: str
@@ -45,7 +45,7 @@ class RaceRunnerResult:
     time_seconds: float
     lengths_behind: float
 
-@dataclass
+@dataclass(slots=True)
 class RaceLogEntry:
     round_num: int
     slot: str
@@ -18,6 +18,8 @@ from __future__ import annotations
 import hashlib
 import random
 from dataclasses import asdict
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -80,6 +82,12 @@ MSR_G1_RACES: List[Tuple[int, str, int, int]] = [
     (6, "Crown", 56, 0x01),
 ]
 
+# race id -> (byte_index, bit_mask). Built from the end so that, as with a
+# front-to-back scan, the first entry wins for a repeated id.
+_G1_BIT_BY_ID: Dict[int, Tuple[int, int]] = {
+    race_id: (byte_idx, bit_mask) for race_id, _name, byte_idx, bit_mask in reversed(MSR_G1_RACES)
+}
+
 
 # ---------------------------------------------------------------------------
 # Small helpers
@@ -114,6 +122,21 @@ def _get_field(obj: Any, field: str) -> Any:
     return getattr(obj, field, None)
 
 
+_PLAYER_POS = attrgetter("player_pos")
+
+
+def _log_pos(entry: Any) -> Any:
+    """`_get_field(entry, "player_pos")` with the attribute read tried first.
+
+    career_log rows are RaceLogEntry objects unless a legacy dict slipped
+    through, so the dict check only runs when the attribute lookup fails.
+    """
+    try:
+        return _PLAYER_POS(entry)
+    except AttributeError:
+        return _get_field(entry, "player_pos")
+
+
 def _sanitize_filename(name: str) -> str:
     # Keep it Windows-friendly.
     bad = '<>:/\\|?*"'
@@ -135,16 +158,15 @@ def _set_string(ar: List[int], start_idx: int, text: str, max_len: int = 18) ->
     if text is None:
         text = ""
     s = str(text)[:max_len]
-    for i in range(max_len):
-        idx = start_idx - i
-        if idx < 0 or idx >= len(ar):
-            break
-        ar[idx] = 0
-    for i, ch in enumerate(s):
-        idx = start_idx - i
-        if idx < 0 or idx >= len(ar):
-            break
-        ar[idx] = ord(ch) & 0xFF
+    if not 0 <= start_idx < len(ar):
+        return
+    # Slots start_idx down to start_idx - max_len + 1 (stopping at index 0):
+    # clear them, then write the characters in reverse as one slice.
+    lo = max(0, start_idx - max_len + 1)
+    ar[lo:start_idx + 1] = [0] * (start_idx + 1 - lo)
+    codes = [ord(ch) & 0xFF for ch in s[:start_idx + 1]]
+    codes.reverse()
+    ar[start_idx + 1 - len(codes):start_idx + 1] = codes
 
 
 # ---------------------------------------------------------------------------
@@ -152,10 +174,31 @@ def _set_string(ar: List[int], start_idx: int, text: str, max_len: int = 18) ->
 # ---------------------------------------------------------------------------
 
 
+# encodeTrack() multiplies the track (indices 1..69, read as one big-endian
+# number) by multiCode, a power of two, adding multiCode - 1 below index 69 and
+# dropping the carry out of index 1. That is a left shift of the whole number.
+_TRACK_BODY_BYTES = 69
+_TRACK_BODY_MASK = (1 << (8 * _TRACK_BODY_BYTES)) - 1
+# (multiCode, shift) pairs in the order encodeTrack() tries them.
+_MULTI_CODE_SHIFTS = ((128, 7), (64, 6), (32, 5), (16, 4), (8, 3), (4, 2), (2, 1), (1, 0))
+
+
+def _xor_bytes(n: int) -> int:
+    """XOR of the bytes of a non-negative int below 2**1024 (halves folded together)."""
+    width = 512
+    while width >= 8:
+        n = (n >> width) ^ (n & ((1 << width) - 1))
+        width >>= 1
+    return n
+
+
 def encode_track(ar_hex: Sequence[int]) -> Optional[str]:
     '''Encode one 70-byte track into the MSR206u-compatible 144-hex-character string.
 
-    This is a direct port of `encodeTrack()` from DOC_Card_Editor.html.
+    This is a port of `encodeTrack()` from DOC_Card_Editor.html. Instead of
+    building newHex byte by byte for every multiCode attempt, each attempt
+    shifts the track as one integer and checks the checksums on that; only
+    the accepted attempt is turned into hex.
     '''
 
     if len(ar_hex) != 70:
@@ -163,68 +206,52 @@ def encode_track(ar_hex: Sequence[int]) -> Optional[str]:
 
     # Clamp to byte range (mirrors typical JS behaviour when values are already valid).
     ar = [int(v) & 0xFF for v in ar_hex]
+    body = int.from_bytes(bytes(ar[1:]), "big")
 
-    for multi_code in (128, 64, 32, 16, 8, 4, 2, 1):
-        # newHex starts with (256 - multiCode)
-        new_hex = f"{256 - multi_code:02X}"
-
-        # Encode index 69
-        new_data = ar[69] * multi_code + multi_code - 1
-        t_val = new_data // 256
-        new_hex = f"{new_data % 256:02X}" + new_hex
-
-        # Encode indices 68..1
-        for idx in range(68, 0, -1):
-            new_data = ar[idx] * multi_code + t_val
-            t_val = new_data // 256
-            new_hex = f"{new_data % 256:02X}" + new_hex
-
-        # Prefix (256 - multiCode) again
-        new_hex = f"{256 - multi_code:02X}" + new_hex
+    for multi_code, shift in _MULTI_CODE_SHIFTS:
+        # newHex = (256 - multiCode), encoded indices 1..69, (256 - multiCode)
+        lead = 256 - multi_code
+        encoded = ((body << shift) | (multi_code - 1)) & _TRACK_BODY_MASK
 
-        # Checksums
-        chksum1 = 255 ^ int(new_hex[0:2], 16)
-        for i in range(2, len(new_hex) - 1, 2):
-            chksum1 ^= int(new_hex[i:i + 2], 16)
-
-        chksum2 = int(new_hex[0:2], 16) ^ int(new_hex[2:4], 16)
-        for i in range(4, len(new_hex) - 3, 2):
-            chksum2 ^= int(new_hex[i:i + 2], 16)
-
-        chksum2 = chksum2 + multi_code - 1
+        # Checksums: chksum1 = 255 ^ newHex bytes 0..70,
+        # chksum2 = (newHex bytes 0..69) + multiCode - 1.
+        x = lead ^ _xor_bytes(encoded)
+        chksum1 = 255 ^ x ^ lead
+        chksum2 = x + multi_code - 1
 
         if chksum1 == chksum2:
-            return f"{chksum1:02X}" + new_hex
+            return (bytes((chksum1, lead)) + encoded.to_bytes(_TRACK_BODY_BYTES, "big") + bytes((lead,))).hex().upper()
 
     return None
 
 
+# NOTE: MSR206u uses a fixed [SETUP] header (identical for all cards) before [DATA].
+# The spacing/line-endings here intentionally match known-good exports.
+_RAW_HEADER = (
+    "[SETUP]\r\n"
+    "CARDTYPE =4\r\n"
+    "PARITY1 =0\r\n"
+    "PARITY2 =0\r\n"
+    "PARITY3 =0\r\n"
+    "BPC1 =8\r\n"
+    "BPC2 =8\r\n"
+    "BPC3 =8\r\n"
+    "SS1 =5\r\n"
+    "SS2 =10\r\n"
+    "SS3 =10\r\n"
+    "ES1 =31\r\n"
+    "ES2 =15\r\n"
+    "ES3 =15\r\n"
+    "\r\n"
+    "[DATA]\r\n"
+)
+
+
 def generate_raw_content(track1_hex: str, track2_hex: str, track3_hex: str) -> str:
     """Build the MSR206u-compatible .RAW text file."""
 
-    # NOTE: MSR206u uses a fixed [SETUP] header (identical for all cards) before [DATA].
-    # The spacing/line-endings here intentionally match known-good exports.
-    header = (
-        "[SETUP]\r\n"
-        "CARDTYPE =4\r\n"
-        "PARITY1 =0\r\n"
-        "PARITY2 =0\r\n"
-        "PARITY3 =0\r\n"
-        "BPC1 =8\r\n"
-        "BPC2 =8\r\n"
-        "BPC3 =8\r\n"
-        "SS1 =5\r\n"
-        "SS2 =10\r\n"
-        "SS3 =10\r\n"
-        "ES1 =31\r\n"
-        "ES2 =15\r\n"
-        "ES3 =15\r\n"
-        "\r\n"
-        "[DATA]\r\n"
-    )
-
     # Control characters 0x01/0x02/0x03 prefix each track line.
-    return header + "\x01" + track1_hex + "\r\n" + "\x02" + track2_hex + "\r\n" + "\x03" + track3_hex + "\r\n"
+    return "".join((_RAW_HEADER, "\x01", track1_hex, "\r\n\x02", track2_hex, "\r\n\x03", track3_hex, "\r\n"))
 
 
 # ---------------------------------------------------------------------------
@@ -285,29 +312,48 @@ def _derive_w_p_s_o_from_career_log(horse: Horse) -> Tuple[int, int, int, int, i
       * a list of CareerLogEntry dataclasses (current)
     """
 
-    total = 0
-    wins = places = shows = outs = 0
+    # Finishes by bucket: [other (pos < 1), wins, places, shows, outs].
+    hist = [0, 0, 0, 0, 0]
 
     for entry in getattr(horse, "career_log", []) or []:
-        pos_val = _get_field(entry, "player_pos")
+        pos_val = _log_pos(entry)
         if pos_val is None:
             continue
         try:
             pos = int(pos_val)
         except Exception:
             continue
+        hist[min(pos, 4) if pos >= 1 else 0] += 1
+
+    return sum(hist), hist[1], hist[2], hist[3], hist[4]
 
-        total += 1
-        if pos == 1:
-            wins += 1
-        elif pos == 2:
-            places += 1
-        elif pos == 3:
-            shows += 1
-        elif pos >= 4:
-            outs += 1
 
-    return total, wins, places, shows, outs
+@lru_cache(maxsize=256)
+def _g1_title_id(race_name: str) -> Optional[int]:
+    """G1 title bit ID (0..6) for a won race's name, or None.
+
+    Career logs repeat the same handful of race names, so matches are cached
+    per name.
+    """
+    if "G1" not in race_name.upper():
+        return None
+
+    rn = race_name.lower()
+    if "unicom" in rn:
+        return 0
+    if "derby" in rn:
+        return 1
+    if "sprinter" in rn and "trophy" in rn:
+        return 2
+    if "1000" in rn and "guine" in rn:
+        return 3
+    if "2000" in rn and "guine" in rn:
+        return 4
+    if "oaks" in rn:
+        return 5
+    if "crown" in rn:
+        return 6
+    return None
 
 
 def _derive_g1_title_ids(horse: Horse) -> List[int]:
@@ -319,6 +365,7 @@ def _derive_g1_title_ids(horse: Horse) -> List[int]:
     """
 
     ids: List[int] = []
+    seen: set[int] = set()
 
     # 1) Prefer explicitly stored IDs (if present)
     ex = horse.extras or {}
@@ -329,12 +376,13 @@ def _derive_g1_title_ids(horse: Horse) -> List[int]:
                 i = int(x)
             except Exception:
                 continue
-            if 0 <= i <= 6 and i not in ids:
+            if 0 <= i <= 6 and i not in seen:
+                seen.add(i)
                 ids.append(i)
 
     # 2) Derive from career_log race names
     for entry in getattr(horse, "career_log", []) or []:
-        pos_val = _get_field(entry, "player_pos")
+        pos_val = _log_pos(entry)
         if pos_val is None:
             continue
         try:
@@ -347,27 +395,9 @@ def _derive_g1_title_ids(horse: Horse) -> List[int]:
         race_name = str(_get_field(entry, "race_name") or "")
         if not race_name:
             continue
-        if "G1" not in race_name.upper():
-            continue
-
-        rn = race_name.lower()
-        match_id: Optional[int] = None
-        if "unicom" in rn:
-            match_id = 0
-        elif "derby" in rn:
-            match_id = 1
-        elif "sprinter" in rn and "trophy" in rn:
-            match_id = 2
-        elif "1000" in rn and "guine" in rn:
-            match_id = 3
-        elif "2000" in rn and "guine" in rn:
-            match_id = 4
-        elif "oaks" in rn:
-            match_id = 5
-        elif "crown" in rn:
-            match_id = 6
-
-        if match_id is not None and match_id not in ids:
+        match_id = _g1_title_id(race_name)
+        if match_id is not None and match_id not in seen:
+            seen.add(match_id)
             ids.append(match_id)
 
     return ids
@@ -376,9 +406,7 @@ def _derive_g1_title_ids(horse: Horse) -> List[int]:
 def _g1_title_bytes(title_ids: Sequence[int]) -> Tuple[int, int, int]:
     """Convert title IDs to the three packed bytes stored at a2[55..57]."""
 
-    b55 = 0
-    b56 = 0
-    b57 = 0
+    packed = {55: 0, 56: 0, 57: 0}
 
     for tid in title_ids:
         try:
@@ -386,18 +414,11 @@ def _g1_title_bytes(title_ids: Sequence[int]) -> Tuple[int, int, int]:
         except Exception:
             continue
 
-        for race_id, _name, byte_idx, bit_mask in MSR_G1_RACES:
-            if race_id != i:
-                continue
-            if byte_idx == 55:
-                b55 |= bit_mask
-            elif byte_idx == 56:
-                b56 |= bit_mask
-            elif byte_idx == 57:
-                b57 |= bit_mask
-            break
-
-    return b55 & 0xFF, b56 & 0xFF, b57 & 0xFF
+        bit = _G1_BIT_BY_ID.get(i)
+        if bit is not None and bit[0] in packed:
+            packed[bit[0]] |= bit[1]
+
+    return packed[55] & 0xFF, packed[56] & 0xFF, packed[57] & 0xFF
 
 
 
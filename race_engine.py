@@ -197,6 +197,11 @@ def _pace_hotness(early_potentials: List[float]) -> float:
     return _clamp(z - 0.25, 0.0, 2.0)
 
 
+def _race_base_seed(seed: int, meet_iter: int, race_meta: RaceMeta, condition: Condition) -> int:
+    """Base seed of one race; every gate/horse stream of that race derives from it."""
+    return hash64(seed, meet_iter, race_meta.course_code, race_meta.distance, race_meta.surface, condition)
+
+
 def draw_gates(
     seed: int,
     meet_iter: int,
@@ -205,7 +210,7 @@ def draw_gates(
     runners: List[Horse],
 ) -> Dict[str, int]:
     """Deterministically draw gates for this race."""
-    base = hash64(seed, meet_iter, race_meta.course_code, race_meta.distance, race_meta.surface, condition)
+    base = _race_base_seed(seed, meet_iter, race_meta, condition)
     gate_rng = RNG(hash64(base, "GATE"))
     gates = list(range(1, len(runners) + 1))
 
@@ -234,9 +239,32 @@ class RaceSimResult:
     payouts_by_pos: Dict[int, int] = field(default_factory=dict)
 
 
+# Per-runner stat columns, read once per race and shared by both scoring passes:
+# (stamina, speed, sharp, start, corner, oob, competing, tenacious, spurt), with
+# externals already mapped through _ext_norm.
+RunnerStats = Tuple[float, float, float, float, float, float, float, float, float]
+
+
+def _runner_stats(h: Horse) -> RunnerStats:
+    ints = h.internals
+    exts = h.externals
+    return (
+        float(_get_field(ints, "stamina", 0)),
+        float(_get_field(ints, "speed", 0)),
+        float(_get_field(ints, "sharp", 0)),
+        _ext_norm(int(_get_field(exts, "start", 8))),
+        _ext_norm(int(_get_field(exts, "corner", 8))),
+        _ext_norm(int(_get_field(exts, "oob", 8))),
+        _ext_norm(int(_get_field(exts, "competing", 8))),
+        _ext_norm(int(_get_field(exts, "tenacious", 8))),
+        _ext_norm(int(_get_field(exts, "spurt", 8))),
+    )
+
+
 def _early_mid_late_base(
     h: Horse,
     *,
+    stats: RunnerStats,
     sprint: float,
     mile: float,
     stayer: float,
@@ -246,16 +274,7 @@ def _early_mid_late_base(
     hrng: RNG,
 ) -> tuple[float, float, float]:
     """Compute base early/mid/late phase scores (before pace/trip/fit scalars)."""
-    st = float(_get_field(h.internals, "stamina", 0))
-    sp = float(_get_field(h.internals, "speed", 0))
-    sh = float(_get_field(h.internals, "sharp", 0))
-
-    start = _ext_norm(int(_get_field(h.externals, "start", 8)))
-    corner = _ext_norm(int(_get_field(h.externals, "corner", 8)))
-    oob = _ext_norm(int(_get_field(h.externals, "oob", 8)))
-    comp = _ext_norm(int(_get_field(h.externals, "competing", 8)))
-    ten = _ext_norm(int(_get_field(h.externals, "tenacious", 8)))
-    spur = _ext_norm(int(_get_field(h.externals, "spurt", 8)))
+    st, sp, sh, start, corner, oob, comp, ten, spur = stats
 
     style = str(h.style)
 
@@ -325,10 +344,10 @@ def run_race_sim(
     The returned scores are relative "performance" values; the reporting layer converts them into
     times + margins and updates records.
     """
-    runners = [player] + list(cpu11)
+    runners = [player, *cpu11]
 
     # Deterministic base seed per race.
-    base = hash64(seed, meet_iter, race_meta.course_code, race_meta.distance, race_meta.surface, condition)
+    base = _race_base_seed(seed, meet_iter, race_meta, condition)
 
     # Gates should be deterministic but not consume the scoring RNG stream.
     if gate_by_id is None:
@@ -339,13 +358,18 @@ def run_race_sim(
     heavy = _condition_heaviness(condition)
 
     # Phase build-up (including gate + break variance)
+    stats_by_id: Dict[str, RunnerStats] = {h.id: _runner_stats(h) for h in runners}
+    # Per-horse stream seeds, derived once. Each pass below starts a fresh
+    # stream from the same seed, so both passes replay the same draws.
+    hseed_by_id: Dict[str, int] = {h.id: hash64(base, h.id, "HORSE") for h in runners}
     phase_by_id: Dict[str, tuple[float, float, float]] = {}
     early_pots: List[float] = []
     for h in runners:
-        hrng = RNG(hash64(base, h.id, "HORSE"))
+        hrng = RNG(hseed_by_id[h.id])
         gate = int(gate_by_id.get(h.id, 1))
         early, mid, late = _early_mid_late_base(
             h,
+            stats=stats_by_id[h.id],
             sprint=sprint,
             mile=mile,
             stayer=stayer,
@@ -365,19 +389,12 @@ def run_race_sim(
 
     scores: Dict[str, float] = {}
     for h in runners:
-        hrng = RNG(hash64(base, h.id, "HORSE"))
+        hrng = RNG(hseed_by_id[h.id])
         gate = int(gate_by_id.get(h.id, 1))
         rank = int(early_rank.get(h.id, 6))
         style = str(h.style)
 
-        st = float(_get_field(h.internals, "stamina", 0))
-        sp = float(_get_field(h.internals, "speed", 0))
-        sh = float(_get_field(h.internals, "sharp", 0))
-
-        start = _ext_norm(int(_get_field(h.externals, "start", 8)))
-        oob = _ext_norm(int(_get_field(h.externals, "oob", 8)))
-        comp = _ext_norm(int(_get_field(h.externals, "competing", 8)))
-        ten = _ext_norm(int(_get_field(h.externals, "tenacious", 8)))
+        st, sp, sh, _start, _corner, oob, comp, ten, _spur = stats_by_id[h.id]
 
         early, mid, late = phase_by_id[h.id]
 
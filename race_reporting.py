@@ -14,6 +14,8 @@ class TimedRace:
     winner_time: float
     record_broken: bool
     record_entry: RecordEntry
+    # True when `records_state` was modified (new par record or a broken record).
+    records_changed: bool = False
 
 def format_time(seconds: float) -> str:
     m = int(seconds // 60)
@@ -49,6 +51,7 @@ def timed_results(
     records_state: Dict[str, RecordEntry],
 ) -> TimedRace:
     # Ensure record exists. If missing, create from synthetic par.
+    n_records = len(records_state)
     rec = ensure_record(
         records_state,
         race.course_code,
@@ -115,7 +118,13 @@ def timed_results(
     else:
         record_broken, new_rec = False, rec
 
-    return TimedRace(runners=out, winner_time=winner_time, record_broken=record_broken, record_entry=new_rec)
+    return TimedRace(
+        runners=out,
+        winner_time=winner_time,
+        record_broken=record_broken,
+        record_entry=new_rec,
+        records_changed=record_broken or len(records_state) != n_records,
+    )
 
 def render_race_card(
     race: RaceMeta,
@@ -1,19 +1,29 @@
 from __future__ import annotations
 import hashlib, random
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, List, Sequence, TypeVar
 
 T = TypeVar("T")
 
-def hash64(*parts: Any) -> int:
-    h = hashlib.blake2b(digest_size=8)
-    for p in parts:
-        h.update(str(p).encode("utf-8"))
-        h.update(b"\x1f")
+@lru_cache(maxsize=4096)
+def _digest64(msg: str) -> int:
+    h = hashlib.blake2b(msg.encode("utf-8"), digest_size=8)
     return int.from_bytes(h.digest(), "big", signed=False)
 
+def hash64(*parts: Any) -> int:
+    # blake2b of str(part) + 0x1f per part, memoized on the joined message.
+    return _digest64("".join([str(p) + "\x1f" for p in parts]))
+
 @dataclass
 class RNG:
+    """Seeded stream for one decision point, e.g. RNG(hash64(seed, "GATE", ...)).
+
+    Each decision gets its own stream keyed by its tag and context instead of
+    sharing one generator per race, so a player choice that draws more or fewer
+    numbers (skipping training, a gambling round) never shifts the results of
+    any other decision, and replays from a save stay identical.
+    """
     seed: int
     _r: random.Random = None  # type: ignore
 
@@ -40,4 +50,5 @@ class RNG:
 
     def tri_centered(self) -> float:
         # approx triangular centered at 0 in [-1.5, +1.5]
-        return (self.random() + self.random() + self.random()) - 1.5
+        r = self._r.random
+        return (r() + r() + r()) - 1.5
@@ -1,20 +1,43 @@
 from __future__ import annotations
 import json
-from dataclasses import asdict
+import os
+from dataclasses import fields
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .models import Horse, RaceLogEntry, RaceRunnerResult, Externals, Internals
 
+try:  # optional: faster parsing/writing of save files
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(state: Dict[str, Any]) -> bytes:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:  # pragma: no cover - stdlib fallback
+    _loads = json.loads
+
+    def _dumps(state: Dict[str, Any]) -> bytes:
+        return json.dumps(state, indent=2).encode("utf-8")
+
+# Flat dataclasses written field by field: same dict as asdict() for these
+# all-scalar records, without its recursive deep-copy walk.
+_INTERNAL_FIELDS = tuple(f.name for f in fields(Internals))
+_EXTERNAL_FIELDS = tuple(f.name for f in fields(Externals))
+_RUNNER_FIELDS = tuple(f.name for f in fields(RaceRunnerResult))
+
+def _flat_dict(obj: Any, names: Tuple[str, ...]) -> Dict[str, Any]:
+    return {k: getattr(obj, k) for k in names}
+
 def horse_to_dict(h: Horse) -> Dict[str, Any]:
+    """The save-file form of `h` as plain JSON types."""
     d = {
         "id": h.id,
         "name": h.name,
         "sex": h.sex,
         "style": h.style,
         "ac": h.ac,
-        "internals": asdict(h.internals),
-        "externals": asdict(h.externals),
+        "internals": _flat_dict(h.internals, _INTERNAL_FIELDS),
+        "externals": _flat_dict(h.externals, _EXTERNAL_FIELDS),
         "extras": getattr(h, "extras", {}),
         "genetic_tokens": h.genetic_tokens,
         "g1_wins": h.g1_wins,
@@ -31,26 +54,49 @@ def horse_to_dict(h: Horse) -> Dict[str, Any]:
             pedigree[k] = v
     if pedigree:
         d["pedigree"] = pedigree
-    for e in h.career_log:
-        d["career_log"].append({
-            "round_num": e.round_num,
-            "slot": e.slot,
-            "race_name": e.race_name,
-            "track": e.track,
-            "course_code": e.course_code,
-            "surface": e.surface,
-            "condition": e.condition,
-            "distance": e.distance,
-            "winner_time": e.winner_time,
-            "player_pos": e.player_pos,
-            "player_time": e.player_time,
-            "player_lengths": e.player_lengths,
-            "payout": e.payout,
-            "earnings_total_after": e.earnings_total_after,
-            "field": [asdict(r) for r in e.field],
-        })
+    d["career_log"] = _career_log_dicts(h)
     return d
 
+def _career_log_entry_dict(e: RaceLogEntry) -> Dict[str, Any]:
+    return {
+        "round_num": e.round_num,
+        "slot": e.slot,
+        "race_name": e.race_name,
+        "track": e.track,
+        "course_code": e.course_code,
+        "surface": e.surface,
+        "condition": e.condition,
+        "distance": e.distance,
+        "winner_time": e.winner_time,
+        "player_pos": e.player_pos,
+        "player_time": e.player_time,
+        "player_lengths": e.player_lengths,
+        "payout": e.payout,
+        "earnings_total_after": e.earnings_total_after,
+        "field": [_flat_dict(r, _RUNNER_FIELDS) for r in e.field],
+    }
+
+def _career_log_dicts(h: Horse) -> list:
+    """Serialized career_log, converting only entries added since the last save.
+
+    Log entries are never edited once appended, so their dicts are kept on the
+    horse as `_career_log_cache` (not persisted) and matched by identity; the
+    game saves after every race, and rebuilding the whole log each time made
+    that O(races run).
+    """
+    cache = getattr(h, "_career_log_cache", None)
+    if cache is None:
+        cache = h._career_log_cache = []
+    log = h.career_log
+    n = 0
+    for (entry, _), e in zip(cache, log):
+        if entry is not e:
+            break
+        n += 1
+    del cache[n:]
+    cache.extend((e, _career_log_entry_dict(e)) for e in log[n:])
+    return [ed for _, ed in cache]
+
 def horse_from_dict(d: Dict[str, Any]) -> Horse:
     h = Horse(
         id=d["id"],
@@ -92,11 +138,43 @@ def horse_from_dict(d: Dict[str, Any]) -> Horse:
         ))
     return h
 
-def save_game(path: Path, state: Dict[str, Any]) -> None:
+def save_game(path: Path, state: Dict[str, Any], durable: bool = False) -> None:
+    """Write `state` to `path`.
+
+    The per-race autosave is a plain overwrite. `durable=True` (quit & save,
+    end of round, retirement archive) writes and fsyncs a temp file next to
+    `path`, then renames it over `path`, so a crash leaves the old or new save
+    intact, never a torn one.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    try:
+        data = _dumps(state)
+    except TypeError:
+        # e.g. ints wider than 64 bits, which orjson refuses.
+        data = json.dumps(state, indent=2).encode("utf-8")
+    if not durable:
+        path.write_bytes(data)
+        return
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
 
 def load_game(path: Path) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
-    return json.loads(path.read_text(encoding="utf-8", errors="ignore"))
+    data = path.read_bytes()
+    try:
+        return _loads(data)
+    except ValueError:
+        # Invalid UTF-8 / NaN etc.: fall back to the lenient stdlib path.
+        return json.loads(data.decode("utf-8", errors="ignore"))
@@ -4,6 +4,8 @@ import json
 from dataclasses import dataclass
 from pathlib import Path
 
+from .file_cache import StampCache, file_stamp
+
 
 @dataclass
 class WorldState:
@@ -44,14 +46,24 @@ def load_world_state(path: Path) -> WorldState:
         return WorldState()
 
 
+# Last text written per path, kept while the file is unchanged on disk. A save
+# that would write the same text again is skipped unless the file has changed
+# since (e.g. another session advanced it).
+_WRITTEN = StampCache()
+
+
 def save_world_state(path: Path, state: WorldState) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
     payload = {
         "current_round": int(state.current_round),
         "cycle": int(state.cycle),
         "race_index": int(state.race_index),
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    text = json.dumps(payload, indent=2)
+    if _WRITTEN.get(path, file_stamp(path)) == text:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    _WRITTEN.put(path, file_stamp(path), text)
 
 
 def reset_world_state(path: Path) -> WorldState: